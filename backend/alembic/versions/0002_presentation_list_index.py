@@ -0,0 +1,45 @@
+"""covering index for presentation listing
+
+Revision ID: 0002_presentation_list_index
+Revises: 0001_baseline_schema
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_presentation_list_index"
+down_revision: Union[str, Sequence[str], None] = "0001_baseline_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LIST_COLUMNS = ["title", "file_path", "file_type", "slide_count", "status"]
+
+
+def upgrade() -> None:
+    # Build the replacement without locking writes, then drop the old (user_id, created_at) index
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_presentation_user_created_covering",
+            "presentations",
+            ["user_id", "created_at"],
+            unique=False,
+            postgresql_include=LIST_COLUMNS,
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_presentation_user_created", table_name="presentations", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_presentation_user_created",
+            "presentations",
+            ["user_id", "created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_presentation_user_created_covering", table_name="presentations", postgresql_concurrently=True)
@@ -0,0 +1,49 @@
+"""store slide embeddings as halfvec
+
+Revision ID: 0003_slide_embedding_halfvec
+Revises: 0002_presentation_list_index
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_slide_embedding_halfvec"
+down_revision: Union[str, Sequence[str], None] = "0002_presentation_list_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+HNSW_PARAMS = {"m": 16, "ef_construction": 64}
+
+
+def upgrade() -> None:
+    # halfvec needs pgvector >= 0.7 (0008 later requires 0.8); databases created from older images still have 0.5.x installed
+    op.execute("ALTER EXTENSION vector UPDATE")
+    op.drop_index("ix_slide_embedding", table_name="slides")
+    op.execute("ALTER TABLE slides ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536)")
+    op.create_index(
+        "ix_slide_embedding",
+        "slides",
+        ["embedding"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_with=HNSW_PARAMS,
+        postgresql_ops={"embedding": "halfvec_cosine_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_slide_embedding", table_name="slides")
+    op.execute("ALTER TABLE slides ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)")
+    op.create_index(
+        "ix_slide_embedding",
+        "slides",
+        ["embedding"],
+        unique=False,
+        postgresql_using="hnsw",
+        postgresql_with=HNSW_PARAMS,
+        postgresql_ops={"embedding": "vector_cosine_ops"},
+    )
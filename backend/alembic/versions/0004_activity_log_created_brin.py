@@ -0,0 +1,43 @@
+"""brin index for activity log time ranges
+
+Revision ID: 0004_activity_log_created_brin
+Revises: 0003_slide_embedding_halfvec
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_activity_log_created_brin"
+down_revision: Union[str, Sequence[str], None] = "0003_slide_embedding_halfvec"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # activity_logs is append-only, so created_at follows physical row order and BRIN can replace the B-tree
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_log_created_brin",
+            "activity_logs",
+            ["created_at"],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_activity_logs_created_at", table_name="activity_logs", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_activity_logs_created_at",
+            "activity_logs",
+            ["created_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_log_created_brin", table_name="activity_logs", postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""store session uuids as native uuid
+
+Revision ID: 0005_session_uuid_native
+Revises: 0004_activity_log_created_brin
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_session_uuid_native"
+down_revision: Union[str, Sequence[str], None] = "0004_activity_log_created_brin"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rewrites the table and rebuilds ix_presentation_sessions_session_uuid on the 16-byte values
+    op.alter_column(
+        "presentation_sessions",
+        "session_uuid",
+        existing_type=sa.String(length=36),
+        type_=sa.Uuid(),
+        existing_nullable=False,
+        postgresql_using="session_uuid::uuid",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "presentation_sessions",
+        "session_uuid",
+        existing_type=sa.Uuid(),
+        type_=sa.String(length=36),
+        existing_nullable=False,
+        postgresql_using="session_uuid::text",
+    )
@@ -0,0 +1,59 @@
+"""partial indexes for guest uploads and unverified users
+
+Revision ID: 0006_partial_guest_unverified
+Revises: 0005_session_uuid_native
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_partial_guest_unverified"
+down_revision: Union[str, Sequence[str], None] = "0005_session_uuid_native"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_presentation_guest_expires", table_name="presentations", postgresql_concurrently=True)
+        op.create_index(
+            "ix_presentation_guest_expires",
+            "presentations",
+            ["expires_at"],
+            unique=False,
+            postgresql_where=sa.text("is_guest_upload = true"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_user_unverified_created",
+            "users",
+            ["created_at"],
+            unique=False,
+            postgresql_where=sa.text("is_active AND NOT email_verified"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_user_active_verified", table_name="users", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_active_verified",
+            "users",
+            ["is_active", "email_verified"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_user_unverified_created", table_name="users", postgresql_concurrently=True)
+        op.drop_index("ix_presentation_guest_expires", table_name="presentations", postgresql_concurrently=True)
+        op.create_index(
+            "ix_presentation_guest_expires",
+            "presentations",
+            ["is_guest_upload", "expires_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,51 @@
+"""drop single-column indexes covered by other indexes
+
+Revision ID: 0007_drop_redundant_indexes
+Revises: 0006_partial_guest_unverified
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_drop_redundant_indexes"
+down_revision: Union[str, Sequence[str], None] = "0006_partial_guest_unverified"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index, table, column): each column already leads the primary key or a composite index
+REDUNDANT_INDEXES = [
+    ("ix_users_id", "users", "id"),
+    ("ix_user_preferences_id", "user_preferences", "id"),
+    ("ix_presentations_id", "presentations", "id"),
+    ("ix_presentations_user_id", "presentations", "user_id"),
+    ("ix_presentations_status", "presentations", "status"),
+    ("ix_slides_id", "slides", "id"),
+    ("ix_slides_presentation_id", "slides", "presentation_id"),
+    ("ix_presentation_sessions_id", "presentation_sessions", "id"),
+    ("ix_presentation_sessions_session_type", "presentation_sessions", "session_type"),
+    ("ix_presentation_analyses_id", "presentation_analyses", "id"),
+    ("ix_notes_id", "notes", "id"),
+    ("ix_notes_user_id", "notes", "user_id"),
+    ("ix_verification_tokens_id", "verification_tokens", "id"),
+    ("ix_verification_tokens_user_id", "verification_tokens", "user_id"),
+    ("ix_verification_tokens_token_type", "verification_tokens", "token_type"),
+    ("ix_activity_logs_id", "activity_logs", "id"),
+    ("ix_activity_logs_user_id", "activity_logs", "user_id"),
+    ("ix_activity_logs_action", "activity_logs", "action"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in REDUNDANT_INDEXES:
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column in REDUNDANT_INDEXES:
+            op.create_index(index_name, table_name, [column], unique=False, postgresql_concurrently=True)
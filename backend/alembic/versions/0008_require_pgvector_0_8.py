@@ -0,0 +1,38 @@
+"""require pgvector >= 0.8 for iterative HNSW scans
+
+Revision ID: 0008_require_pgvector_0_8
+Revises: 0007_drop_redundant_indexes
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008_require_pgvector_0_8"
+down_revision: Union[str, Sequence[str], None] = "0007_drop_redundant_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# rag_service sets hnsw.iterative_scan, which older versions reject as an invalid parameter name
+MIN_PGVECTOR_VERSION = (0, 8, 0)
+
+
+def upgrade() -> None:
+    op.execute("ALTER EXTENSION vector UPDATE")
+    version = op.get_bind().execute(
+        text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+    ).scalar_one()
+    if tuple(int(part) for part in version.split(".")) < MIN_PGVECTOR_VERSION:
+        raise RuntimeError(
+            f"pgvector {version} is installed, but >= {'.'.join(map(str, MIN_PGVECTOR_VERSION))} is required "
+            "(hnsw.iterative_scan). Install a newer pgvector build on the server, then re-run the migration."
+        )
+
+
+def downgrade() -> None:
+    # The extension is not downgraded; nothing in the schema changed
+    pass
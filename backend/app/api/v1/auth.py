@@ -1,50 +1,88 @@
+import hashlib
+import time
+from collections import namedtuple
 from typing import Any
 from datetime import timedelta
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, exists
 from sqlalchemy.future import select
 from jose import jwt, JWTError
 from app.models.presentation import User
-from app.core.database import AsyncSessionLocal
+from app.core.database import get_db
 from app.core import security
 from app.services import email_service
-from app.schemas.auth import ForgotPassword, ResetPassword
 from app.core.logger import logger
 from app.models import presentation as models
 from app.schemas import auth as schemas
 from app.core.config import settings
 # Define the API router login register endpoints
 router = APIRouter()
-#async database dependency
-async def get_db():
-    async with AsyncSessionLocal() as session:
-        yield session
+
+# Statements built once at import; SQLAlchemy's compiled cache reuses them across requests
+_GET_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_EMAIL_EXISTS = select(exists().where(User.email == bindparam("email")))
+PASSWORD_RESET_TOKEN_TTL = timedelta(minutes=settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES)
+
+
+# Decoded JWT payloads keyed by a BLAKE2 digest of the raw token, so repeated
+# requests with the same bearer token skip signature verification.
+_jwt_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+
+def decode_token(token: str) -> dict:
+    """
+    Decodes a JWT, serving recently verified tokens from an in-memory cache.
+    Raises JWTError if the token is invalid or expired.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    payload = _jwt_cache.get(key)
+    if payload is not None:
+        if payload.get("exp", 0) > time.time():
+            return payload
+        _jwt_cache.pop(key, None)
+        raise JWTError("Signature has expired.")
+
+    payload = jwt.decode(token, security.jwt_key, algorithms=[settings.ALGORITHM])
+    _jwt_cache[key] = payload
+    return payload
+
+# Detached snapshot of the fields downstream endpoints read from current_user.
+UserLite = namedtuple("UserLite", "id email full_name birth_date is_active")
+
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=60)
 
 async def get_current_user(
     token: str = Depends(security.oauth2_scheme),
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> UserLite:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_token(token)
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-        
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+
+    cached_user = _user_cache.get(int(user_id))
+    if cached_user is not None:
+        return cached_user
+
+    # Primary-key lookup goes through the session identity map first
+    user = await db.get(User, int(user_id))
     
     if user is None:
         raise credentials_exception
-        
-    return user
+
+    cached_user = UserLite(user.id, user.email, user.full_name, user.birth_date, user.is_active)
+    _user_cache[user.id] = cached_user
+    return cached_user
 @router.post("/register", response_model=schemas.UserResponse)
 async def register(
     user_in: schemas.UserCreate,
@@ -53,25 +91,25 @@ async def register(
     """
     New user registration with email and password.
     """
-    result = await db.execute(select(models.User).where(models.User.email == user_in.email))
-    existing_user = result.scalar_one_or_none()
-    
-    if existing_user:
+    if await db.scalar(_EMAIL_EXISTS, {"email": user_in.email}):
         raise HTTPException(
             status_code=400,
             detail="This email is already registered."
         )
 
+    password_hash = await security.get_password_hash_async(user_in.password)
+
     user = models.User(
         email=user_in.email,
-        password_hash=security.get_password_hash(user_in.password),
+        password_hash=password_hash,
         full_name=user_in.full_name,
         birth_date=user_in.birth_date
     )
     
+    # No refresh: id comes back from the INSERT and every field in UserResponse is set client-side
     db.add(user)
     await db.commit()
-    await db.refresh(user)
+    _user_cache.pop(user.id, None)
     
     return user
 
@@ -85,15 +123,21 @@ async def login(
     Email and password used for user authentication.
     Note: OAuth2PasswordRequestForm has 'username' field for email.
     """
-    result = await db.execute(select(models.User).where(models.User.email == form_data.username))
+    result = await db.execute(_GET_USER_BY_EMAIL, {"email": form_data.username})
     user = result.scalar_one_or_none()
 
-    if not user or not security.verify_password(form_data.password, user.password_hash):
+    if not user or not await security.verify_password_async(form_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Wrong email or password.",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    # Lazily migrate legacy bcrypt hashes to argon2id on successful login
+    if security.password_needs_rehash(user.password_hash):
+        user.password_hash = await security.get_password_hash_async(form_data.password)
+        db.add(user)
+        await db.commit()
     
     access_token = security.create_access_token(subject=user.id)
     
@@ -104,7 +148,7 @@ async def login(
 
 @router.get("/me", response_model=schemas.UserResponse)
 async def get_me(
-    current_user: User = Depends(get_current_user)
+    current_user: UserLite = Depends(get_current_user)
 ) -> Any:
     """
     Get current user profile information.
@@ -114,19 +158,18 @@ async def get_me(
 
 @router.post("/forgot-password")
 async def forgot_password(
-    payload: ForgotPassword,
+    payload: schemas.ForgotPassword,
     background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ) -> Any:
     """Generates a password-reset token and sends a reset link to the given email.
     Returns a generic success message regardless of whether the email exists.
     """
-    result = await db.execute(select(models.User).where(models.User.email == payload.email))
+    result = await db.execute(_GET_USER_BY_EMAIL, {"email": payload.email})
     user = result.scalar_one_or_none()
 
     if user:
-        expires = timedelta(minutes=settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES)
-        token = security.create_access_token(subject=user.id, expires_delta=expires)
+        token = security.create_access_token(subject=user.id, expires_delta=PASSWORD_RESET_TOKEN_TTL)
         background_tasks.add_task(email_service.send_password_reset_email, user.email, token)
     else:
         logger.warning(f"Password reset requested for unknown email: {payload.email}")
@@ -136,25 +179,25 @@ async def forgot_password(
 
 @router.post("/reset-password")
 async def reset_password(
-    payload: ResetPassword,
+    payload: schemas.ResetPassword,
     db: AsyncSession = Depends(get_db)
 ) -> Any:
     """Resets the user's password using a valid token and new password."""
     try:
-        data = jwt.decode(payload.token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        data = jwt.decode(payload.token, security.jwt_key, algorithms=[settings.ALGORITHM])
         user_id: str = data.get("sub")
         if user_id is None:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid token")
     except JWTError:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid token")
 
-    result = await db.execute(select(models.User).where(models.User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+    user = await db.get(models.User, int(user_id))
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    user.password_hash = security.get_password_hash(payload.new_password)
+    user.password_hash = await security.get_password_hash_async(payload.new_password)
     db.add(user)
     await db.commit()
+    _user_cache.pop(user.id, None)
 
     return {"msg": "Password has been reset successfully."}
\ No newline at end of file
@@ -1,29 +1,16 @@
-from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from pydantic import BaseModel, Field
 
 from app.api.v1 import auth
-from app.core.database import AsyncSessionLocal
+from app.core.database import get_db
 from app.core.logger import logger
 from app.services import rag_service
 from app.models.presentation import Presentation
+from app.schemas.chat import ChatRequest, ChatResponse
 
 router = APIRouter()
 
-async def get_db():
-    async with AsyncSessionLocal() as session:
-        yield session
-
-
-class ChatRequest(BaseModel):
-    question: str = Field(..., min_length=1, max_length=500, description="Question about the presentation (max 500 characters)")
-    current_slide: Optional[int] = Field(None, description="The current slide being viewed")
-
-class ChatResponse(BaseModel):
-    answer: str
-    sources: list[int]
 
 @router.post("/{presentation_id}", response_model=ChatResponse)
 async def ask_presentation(
@@ -36,6 +23,7 @@ async def ask_presentation(
     Ask a question about a specific presentation.
     The AI will automatically detect the language of the question and respond in the same language.
     """
+    # The RAG query fetches the slides it needs, so only the presentation row is loaded here
     stmt = select(Presentation).where(
         Presentation.id == presentation_id,
         Presentation.user_id == current_user.id
@@ -49,11 +37,9 @@ async def ask_presentation(
     try:
         response = await rag_service.ask_question(
             db=db, 
-            presentation_id=presentation_id, 
+            presentation=presentation, 
             question=chat_request.question,
-            current_slide=chat_request.current_slide,
-            presentation_title=presentation.title,
-            total_slides=presentation.slide_count or 0
+            current_slide=chat_request.current_slide
         )
         return response
 
@@ -1,105 +1,187 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
-from typing import Dict, List
-import json
+from typing import Dict, Set
+import asyncio
+import contextlib
+import orjson
 from app.services import intent_service
 from app.core.logger import logger
 from app.core.database import AsyncSessionLocal
 from app.models.presentation import PresentationSession, Base
-from sqlalchemy import select, update, text
+from sqlalchemy import select, update, text, bindparam
 
 router = APIRouter()
 
+# Latest slide index per presentation, written to the DB in batches by _slide_flusher
+SLIDE_FLUSH_INTERVAL = 0.5  # seconds
+pending_slide_updates: Dict[int, int] = {}
+_slide_flusher_task: asyncio.Task | None = None
+
+async def flush_slide_updates():
+    """
+    Writes all pending slide indexes to their active sessions in a single executemany UPDATE.
+    """
+    if not pending_slide_updates:
+        return
+    updates = [{"b_pid": pid, "b_slide": slide} for pid, slide in pending_slide_updates.items()]
+    pending_slide_updates.clear()
+
+    stmt = (
+        update(PresentationSession.__table__)
+        .where(PresentationSession.presentation_id == bindparam("b_pid"))
+        .where(PresentationSession.ended_at == None)
+        .values(current_slide_index=bindparam("b_slide"))
+    )
+    try:
+        async with AsyncSessionLocal() as db:
+            await db.execute(stmt, updates)
+            await db.commit()
+        logger.debug(f"Persisted slide state for {len(updates)} presentation(s)")
+    except Exception as db_err:
+        logger.error(f"Database session update failed: {db_err}")
+
+async def _slide_flusher():
+    while True:
+        await asyncio.sleep(SLIDE_FLUSH_INTERVAL)
+        await flush_slide_updates()
+
+def start_slide_flusher():
+    global _slide_flusher_task
+    if _slide_flusher_task is None or _slide_flusher_task.done():
+        _slide_flusher_task = asyncio.create_task(_slide_flusher())
+
+async def stop_slide_flusher():
+    global _slide_flusher_task
+    if _slide_flusher_task is not None:
+        _slide_flusher_task.cancel()
+        try:
+            await _slide_flusher_task
+        except asyncio.CancelledError:
+            pass
+        _slide_flusher_task = None
+    # Don't lose the last positions on shutdown
+    await flush_slide_updates()
+
 class ConnectionManager:
     def __init__(self):
-        # active_connections[presentation_id] = [WebSocket, ...]
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+        # active_connections[presentation_id] = {WebSocket, ...}
+        self.active_connections: Dict[str, Set[WebSocket]] = {}
 
     async def connect(self, presentation_id: str, websocket: WebSocket):
         logger.info(f"Attempting to accept WebSocket connection for presentation {presentation_id}")
         await websocket.accept()
-        if presentation_id not in self.active_connections:
-            self.active_connections[presentation_id] = []
-        self.active_connections[presentation_id].append(websocket)
+        self.active_connections.setdefault(presentation_id, set()).add(websocket)
         logger.info(f"New connection for presentation {presentation_id}. Total: {len(self.active_connections[presentation_id])}")
 
     def disconnect(self, presentation_id: str, websocket: WebSocket):
         if presentation_id in self.active_connections:
-            self.active_connections[presentation_id].remove(websocket)
+            self.active_connections[presentation_id].discard(websocket)
             if not self.active_connections[presentation_id]:
                 del self.active_connections[presentation_id]
         logger.info(f"Disconnected from presentation {presentation_id}")
 
     async def send_personal_message(self, message: dict, websocket: WebSocket):
-        await websocket.send_json(message)
+        await websocket.send_text(orjson.dumps(message).decode())
 
     async def broadcast(self, presentation_id: str, message: dict):
         if presentation_id in self.active_connections:
-            # Create a copy of the list to iterate safely
+            # Snapshot the set to iterate safely
             connections = list(self.active_connections[presentation_id])
-            for connection in connections:
-                try:
-                    await connection.send_json(message)
-                except Exception as e:
-                    logger.warning(f"Failed to send message to a connection for {presentation_id}: {str(e)}")
-                    # Optionally remove the broken connection
-                    if connection in self.active_connections[presentation_id]:
-                        self.active_connections[presentation_id].remove(connection)
+            # Serialize once and fan out to all listeners concurrently
+            # Text frames: the frontend JSON.parses event.data, which a binary frame would break
+            data = orjson.dumps(message).decode()
+            results = await asyncio.gather(
+                *[connection.send_text(data) for connection in connections],
+                return_exceptions=True
+            )
+            for connection, result in zip(connections, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to send message to a connection for {presentation_id}: {str(result)}")
+                    # Remove the broken connection
+                    self.active_connections.get(presentation_id, set()).discard(connection)
 
 manager = ConnectionManager()
 
+# Final transcripts waiting for intent analysis per connection; older ones are dropped when full
+INTENT_QUEUE_SIZE = 2
+
+async def _intent_worker(presentation_id: str, queue: asyncio.Queue):
+    """
+    Consumes final transcripts and broadcasts detected commands, so a slow LLM call
+    never blocks reading the socket.
+    """
+    # Speech recognizers often re-send the same final phrase; reuse the previous analysis for it
+    last_key = None
+    last_result = None
+    while True:
+        transcript, current_slide, total_slides = await queue.get()
+        try:
+            key = (transcript.strip().lower(), current_slide, total_slides)
+            if key == last_key:
+                result = last_result
+                logger.debug("Reusing intent analysis for repeated transcript on {}", presentation_id)
+            else:
+                # Perform intent analysis with context
+                logger.info(f"Analyzing intent for presentation {presentation_id} (Slide {current_slide}/{total_slides}): {transcript}")
+                result = await intent_service.analyze_intent(transcript, current_slide, total_slides)
+                logger.info(f"Analysis result for {presentation_id}: intent={result.intent}, target={result.slide_number}")
+                last_key, last_result = key, result
+            
+            # Only transitions are sent: a command that lands on the slide already shown
+            # (e.g. "next" on the last slide) would just make every client re-render
+            if result.intent != intent_service.IntentType.UNKNOWN and result.slide_number != current_slide:
+                # Broadcast the command to all listeners
+                command_message = {
+                    "type": "COMMAND",
+                    "payload": result.to_dict()
+                }
+                await manager.broadcast(presentation_id, command_message)
+        except Exception as e:
+            logger.error(f"Intent processing failed for {presentation_id}: {str(e)}")
+
 @router.websocket("/ws/presentation/{presentation_id}")
 async def websocket_orchestration(websocket: WebSocket, presentation_id: str):
     logger.info(f"[WebSocket Handshake] Start for presentation_id: {presentation_id}")
     logger.debug(f"Loaded tables: {list(Base.metadata.tables.keys())}")
+    # Parse the path parameter once instead of on every persisted message
+    try:
+        pid_int = int(presentation_id)
+    except ValueError:
+        logger.warning(f"[WebSocket Handshake] Rejected non-numeric presentation_id: {presentation_id}")
+        await websocket.close(code=1008)
+        return
+
     try:
         await manager.connect(presentation_id, websocket)
         logger.info(f"[WebSocket Handshake] Connection accepted for {presentation_id}")
     except Exception as e:
         logger.error(f"[WebSocket Handshake] Failed for {presentation_id}: {str(e)}")
         return
-        
+
+    intent_queue: asyncio.Queue = asyncio.Queue(maxsize=INTENT_QUEUE_SIZE)
+    intent_task = asyncio.create_task(_intent_worker(presentation_id, intent_queue))
+
     try:
         while True:
             # Receive text from the client (real-time transcript segment)
             data = await websocket.receive_text()
-            logger.debug(f"Received WebSocket message for {presentation_id}: {data[:50]}...")
+            # Positional args: loguru only formats the message if a handler accepts DEBUG
+            logger.debug("Received WebSocket message for {}: {:.50}...", presentation_id, data)
             try:
-                payload = json.loads(data)
+                payload = orjson.loads(data)
                 transcript = payload.get("transcript", "")
                 is_final = payload.get("is_final", False)
                 current_slide = payload.get("current_page", 1)
                 total_slides = payload.get("total_pages", 1)
                 
                 if is_final:
-                    # Perform intent analysis with context
-                    logger.info(f"Analyzing intent for presentation {presentation_id} (Slide {current_slide}/{total_slides}): {transcript}")
-                    result = await intent_service.analyze_intent(transcript, current_slide, total_slides)
-                    logger.info(f"Analysis result for {presentation_id}: intent={result.intent}, target={result.slide_number}")
+                    # Hand off to the intent worker; if it is behind, drop the oldest pending transcript
+                    if intent_queue.full():
+                        stale = intent_queue.get_nowait()
+                        logger.debug("Dropping stale transcript for {}: {}", presentation_id, stale[0])
+                    intent_queue.put_nowait((transcript, current_slide, total_slides))
                     
-                    if result.intent != intent_service.IntentType.UNKNOWN:
-                        # Broadcast the command to all listeners
-                        command_message = {
-                            "type": "COMMAND",
-                            "payload": result.to_dict()
-                        }
-                        await manager.broadcast(presentation_id, command_message)
-                    
-                    # Persist the current state to the latest active session (no await to keep responsive)
-                    try:
-                        async with AsyncSessionLocal() as db:
-                            # Update the most recent active session for this presentation
-                            # Note: presentation_id is a string from the URL, converting to int
-                            stmt = (
-                                update(PresentationSession)
-                                .where(PresentationSession.presentation_id == int(presentation_id))
-                                .where(PresentationSession.ended_at == None)
-                                .values(current_slide_index=current_slide)
-                            )
-                            await db.execute(stmt)
-                            await db.commit()
-                            logger.debug(f"Persisted slide state {current_slide} for presentation {presentation_id}")
-                    except Exception as db_err:
-                        logger.error(f"Database session update failed for {presentation_id}: {db_err}")
+                    # Queue the current state; the background flusher persists the latest value
+                    pending_slide_updates[pid_int] = current_slide
                 
                 else:
                     # Broadcast interim transcript for UI feedback
@@ -111,11 +193,17 @@ async def websocket_orchestration(websocket: WebSocket, presentation_id: str):
                 # Optionally echo back transcript acknowledgment or partial processing
                 # For now, we mainly care about the intent detection commands
                 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.error(f"Invalid JSON received on WebSocket: {data}")
                 
     except WebSocketDisconnect:
-        manager.disconnect(presentation_id, websocket)
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {str(e)}")
+    finally:
+        # Always release the connection, including on task cancellation
+        intent_task.cancel()
+        # Wait for it to unwind so it can't broadcast after disconnect or be collected while pending
+        with contextlib.suppress(asyncio.CancelledError):
+            await intent_task
         manager.disconnect(presentation_id, websocket)
@@ -1,34 +1,60 @@
 from fastapi import APIRouter, Depends, UploadFile, File, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.v1 import auth
-from app.core.database import AsyncSessionLocal
+from app.core.database import get_db
 from app.core.logger import logger
 from app.core.exceptions import FileProcessingError, ValidationError
 from app.services import pdf_service, pptx_service, embedding_service, vector_db, file_validator
+import aiofiles
+import hashlib
 import os
-import shutil
-import uuid
+import re
+import secrets
 
 router = APIRouter()
 
+UPLOAD_DIR = "uploaded_files"
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+
+# Anything outside this set is replaced in stored filenames (blocks path separators and traversal)
+UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+MAX_STORED_NAME_LENGTH = 128
+
 # File size limit: 50MB
 MAX_FILE_SIZE = 50 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB reads/writes amortize syscall cost
 
-from sqlalchemy import select, func, desc
+# Accepted extensions and the extractor that turns each into per-slide text
+SLIDE_EXTRACTORS = {
+    ".pdf": pdf_service.extract_text_from_pdf_path,
+    ".pptx": pptx_service.extract_text_from_pptx_path,
+}
+
+from sqlalchemy import select, delete, func, desc
 from app.models.presentation import Presentation, PresentationSession, SessionType
 
-async def get_db():
-    async with AsyncSessionLocal() as session:
-        yield session
 
 @router.get("/", response_model=list)
 async def list_presentations(
     db: AsyncSession = Depends(get_db),
     current_user = Depends(auth.get_current_user)
 ):
-    stmt = select(Presentation).where(Presentation.user_id == current_user.id).order_by(Presentation.created_at.desc())
+    # Only the listed columns, so no ORM objects are built and the covering index can serve the query
+    stmt = (
+        select(
+            Presentation.id,
+            Presentation.title,
+            Presentation.file_path,
+            Presentation.file_type,
+            Presentation.slide_count,
+            Presentation.status,
+            Presentation.created_at
+        )
+        .where(Presentation.user_id == current_user.id)
+        .order_by(Presentation.created_at.desc())
+    )
     result = await db.execute(stmt)
-    presentations = result.scalars().all()
+    presentations = result.all()
     
     return [
         {
@@ -50,12 +76,15 @@ async def get_presentation(
     db: AsyncSession = Depends(get_db),
     current_user = Depends(auth.get_current_user)
 ):
-    stmt = select(Presentation).where(
-        Presentation.id == presentation_id,
-        Presentation.user_id == current_user.id
-    )
-    result = await db.execute(stmt)
-    presentation = result.scalar_one_or_none()
+    stmt = select(
+        Presentation.id,
+        Presentation.title,
+        Presentation.file_path,
+        Presentation.file_type,
+        Presentation.slide_count,
+        Presentation.status
+    ).where(Presentation.id == presentation_id, Presentation.user_id == current_user.id)
+    presentation = (await db.execute(stmt)).one_or_none()
     
     if not presentation:
         raise ValidationError("Presentation not found")
@@ -70,6 +99,19 @@ async def get_presentation(
         "status": presentation.status
     }
 
+def _discard_upload(file_path: str) -> None:
+    """Removes a partially written or unprocessable upload."""
+    try:
+        os.unlink(file_path)
+        logger.info(f"Cleaned up file after error: {file_path}")
+    except FileNotFoundError:
+        pass
+    except OSError as cleanup_error:
+        logger.warning(
+            f"Failed to clean up file after error: {file_path}. Cleanup error: {cleanup_error}",
+            exc_info=True,
+        )
+
 @router.post("/upload", status_code=status.HTTP_201_CREATED)
 async def upload_presentation(
     file: UploadFile = File(...),
@@ -79,58 +121,64 @@ async def upload_presentation(
     logger.info(f"Upload request from user {current_user.id}: {file.filename}")
 
     # Validate file extension
-    if not (file.filename.endswith(".pdf") or file.filename.endswith(".pptx")):
+    extension = os.path.splitext(file.filename)[1]
+    extract_slide_texts = SLIDE_EXTRACTORS.get(extension)
+    if extract_slide_texts is None:
         logger.warning(f"Invalid file type attempted: {file.filename}")
         raise ValidationError("Only PDF and PPTX files are accepted.")
 
-    # Validate file size first (more efficient to fail early)
-    file.file.seek(0, 2)  # Move to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning
-    
-    if file_size > MAX_FILE_SIZE:
-        logger.warning(f"File too large: {file_size} bytes from user {current_user.id}")
-        raise ValidationError(f"File size exceeds limit. Maximum allowed: {MAX_FILE_SIZE // (1024*1024)}MB")
-    
-    if file_size == 0:
-        logger.warning(f"Empty file uploaded: {file.filename}")
-        raise ValidationError("File is empty.")
-    
-    # Read first 512 bytes for magic byte validation
-    file_header = await file.read(512)
-    file.file.seek(0)
-    
-    # Validate file type using magic bytes (not just extension)
-    file_validator.validate_file_type(file_header, file.filename)
-
-    upload_dir = "uploaded_files"
-    os.makedirs(upload_dir, exist_ok=True)
-    
     # Generate unique filename to prevent overwrite
-    unique_id = uuid.uuid4().hex
-    safe_filename = f"{current_user.id}_{unique_id}_{file.filename}"
-    file_path = f"{upload_dir}/{safe_filename}"
-    
+    # Keep the tail when trimming so the extension survives
+    safe_name = UNSAFE_FILENAME_CHARS.sub("_", os.path.basename(file.filename))[-MAX_STORED_NAME_LENGTH:]
+    unique_id = secrets.token_hex(8)
+    safe_filename = f"{current_user.id}_{unique_id}_{safe_name}"
+    file_path = f"{UPLOAD_DIR}/{safe_filename}"
+
+    # Stream the upload to disk once, tracking the size and hash as we go so oversized files fail early
+    # and the saved file never has to be read back just to hash it
+    file_size = 0
+    sha256_hash = hashlib.sha256()
+    try:
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                if file_size == 0:
+                    # Validate file type using magic bytes (not just extension)
+                    file_validator.validate_file_type(chunk[:512], file.filename)
+                file_size += len(chunk)
+                if file_size > MAX_FILE_SIZE:
+                    logger.warning(f"File too large: over {MAX_FILE_SIZE} bytes from user {current_user.id}")
+                    raise ValidationError(f"File size exceeds limit. Maximum allowed: {MAX_FILE_SIZE // (1024*1024)}MB")
+                sha256_hash.update(chunk)
+                await buffer.write(chunk)
+
+        if file_size == 0:
+            logger.warning(f"Empty file uploaded: {file.filename}")
+            raise ValidationError("File is empty.")
+    except ValidationError:
+        _discard_upload(file_path)
+        raise
+    except Exception as e:
+        # Disk full, a failed read from the client, ...: the same cleanup and error as a failed extraction
+        _discard_upload(file_path)
+        logger.error(f"Saving upload failed for user {current_user.id}: {str(e)}", exc_info=True)
+        raise FileProcessingError(
+            message="Failed to save presentation",
+            details=str(e)
+        )
+    except BaseException:
+        # Cancelled mid-write (client gone, shutdown): don't leave a partial file behind
+        _discard_upload(file_path)
+        raise
+
     try:
-        # Save file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
         logger.info(f"File saved: {file_path}")
         
-        # Calculate file hash for analytics (optional)
-        file_hash = file_validator.calculate_file_hash(file_path)
-        
-        file.file.seek(0)
+        # File hash for analytics (optional), computed while streaming
+        file_hash = sha256_hash.hexdigest()
 
         # Extract text based on file type (with security validation)
-        if file.filename.endswith(".pdf"):
-            slide_texts = await pdf_service.extract_text_from_pdf(file, file_size)
-            logger.info(f"Extracted {len(slide_texts)} slides from PDF")
-        elif file.filename.endswith(".pptx"):
-            slide_texts = await pptx_service.extract_text_from_pptx(file, file_size)
-            logger.info(f"Extracted {len(slide_texts)} slides from PPTX")
-        else:
-            raise ValidationError("Unsupported file type")
+        slide_texts = await extract_slide_texts(file_path, file_size)
+        logger.info(f"Extracted {len(slide_texts)} slides from {extension[1:].upper()}")
 
         # Generate embeddings in parallel (10x faster!)
         logger.info(f"Generating embeddings for {len(slide_texts)} slides...")
@@ -157,16 +205,7 @@ async def upload_presentation(
 
     except Exception as e:
         # Clean up uploaded file on error
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-                logger.info(f"Cleaned up file after error: {file_path}")
-            except Exception as cleanup_error:
-                logger.warning(
-                    f"Failed to clean up file after error: {file_path}. Cleanup error: {cleanup_error}",
-                    exc_info=True,
-                )
-        
+        _discard_upload(file_path)
         logger.error(f"Upload failed for user {current_user.id}: {str(e)}", exc_info=True)
         raise FileProcessingError(
             message="Failed to process presentation",
@@ -181,26 +220,25 @@ async def delete_presentation(
 ):
     """Delete a presentation"""
     
-    stmt = select(Presentation).where(
-        Presentation.id == presentation_id,
-        Presentation.user_id == current_user.id
+    file_path = await db.scalar(
+        select(Presentation.file_path)
+        .where(Presentation.id == presentation_id, Presentation.user_id == current_user.id)
     )
-    result = await db.execute(stmt)
-    presentation = result.scalar_one_or_none()
     
-    if not presentation:
+    if file_path is None:
         raise ValidationError("Presentation not found")
     
     # Delete file from disk
-    if os.path.exists(presentation.file_path):
-        try:
-            os.remove(presentation.file_path)
-            logger.info(f"Deleted file: {presentation.file_path}")
-        except Exception as e:
-            logger.warning(f"Failed to delete file: {presentation.file_path}. Error: {e}")
+    try:
+        os.unlink(file_path)
+        logger.info(f"Deleted file: {file_path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to delete file: {file_path}. Error: {e}")
     
-    # Delete from database (cascade will handle related records)
-    await db.delete(presentation)
+    # Delete from database (ON DELETE CASCADE foreign keys handle related records)
+    await db.execute(delete(Presentation).where(Presentation.id == presentation_id))
     await db.commit()
     
     logger.info(f"Presentation deleted: ID={presentation_id}, User={current_user.id}")
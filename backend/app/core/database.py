@@ -6,7 +6,11 @@ from app.core.config import settings
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=True, 
-    future=True
+    future=True,
+    pool_size=20,
+    max_overflow=40,  # burst headroom so short requests do not queue on the pool
+    pool_pre_ping=False,  # avoids an extra SELECT 1 round-trip on every checkout
+    pool_recycle=3600
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -16,4 +20,9 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False
 )
 
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+#async database dependency shared by all routers, so FastAPI resolves it once per request
+async def get_db():
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -0,0 +1,20 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Slightly oversubscribe the cores: workers spend part of their time on file I/O
+EXTRACTION_WORKERS = max(1, int((os.cpu_count() or 1) * 1.5))
+
+# Process pool for CPU-heavy document extraction, created lazily and shut down on app exit.
+_extraction_pool: ProcessPoolExecutor | None = None
+
+def get_extraction_pool() -> ProcessPoolExecutor:
+    global _extraction_pool
+    if _extraction_pool is None:
+        _extraction_pool = ProcessPoolExecutor(max_workers=EXTRACTION_WORKERS)
+    return _extraction_pool
+
+def shutdown_extraction_pool() -> None:
+    global _extraction_pool
+    if _extraction_pool is not None:
+        _extraction_pool.shutdown(wait=False, cancel_futures=True)
+        _extraction_pool = None
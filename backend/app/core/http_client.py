@@ -0,0 +1,21 @@
+import httpx
+
+# Shared HTTP client for outbound API calls (OpenAI). Keep-alive connections and HTTP/2
+# multiplexing avoid a new TLS handshake per request; created lazily, closed on app exit.
+_http_client: httpx.AsyncClient | None = None
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -15,26 +15,34 @@ is_production = settings.ENV.lower() in ["production", "prod"]
 
 # Check if logging is enabled
 if settings.ENABLE_LOGGING:
+    # Every sink uses enqueue=True: callers only push onto a queue and a background thread does the writes,
+    # so request handlers never wait on stderr or disk
     # Console output (always enabled when logging is on)
     logger.add(
         sys.stderr,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         level=settings.LOG_LEVEL,
-        colorize=True
+        # ANSI colors only for a terminal; piped output (docker logs, CI) gets plain text
+        colorize=sys.stderr.isatty(),
+        enqueue=True
     )
 
     # File output configuration based on environment
     if is_production:
         # Production: Conservative logging
+        # One JSON object per line for log shippers; time, level and location are fields of the record,
+        # so the text part only needs the message
         logger.add(
-            "logs/app.log",
+            "logs/app.jsonl",
             rotation="20 MB",
             retention="7 days",
             compression="zip",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+            format="{message}",
+            serialize=True,
             level=settings.LOG_LEVEL,
             backtrace=True,
-            diagnose=False
+            diagnose=False,
+            enqueue=True
         )
         
         logger.add(
@@ -45,7 +53,8 @@ if settings.ENABLE_LOGGING:
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
             level="ERROR",
             backtrace=True,
-            diagnose=False
+            diagnose=False,
+            enqueue=True
         )
     else:
         # Development: Verbose logging
@@ -57,7 +66,8 @@ if settings.ENABLE_LOGGING:
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
             level=settings.LOG_LEVEL,
             backtrace=True,
-            diagnose=True
+            diagnose=True,
+            enqueue=True
         )
         
         logger.add(
@@ -68,7 +78,8 @@ if settings.ENABLE_LOGGING:
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
             level="ERROR",
             backtrace=True,
-            diagnose=True
+            diagnose=True,
+            enqueue=True
         )
 
     # Log startup configuration
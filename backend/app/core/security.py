@@ -1,25 +1,37 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any, Union
-from jose import jwt
+from jose import jwk, jwt
 from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context: argon2id for new hashes, bcrypt kept so legacy hashes still verify.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,
+    argon2__parallelism=2,
+)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
-# Password hashing context using bcrypt algorithm.
+
+# Signing key built once; given a plain string, jose re-parses it into a key object on every encode and decode
+jwt_key = jwk.construct(settings.SECRET_KEY, settings.ALGORITHM)
+ACCESS_TOKEN_TTL = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
 def create_access_token(subject: Union[str, Any], expires_delta: timedelta = None) -> str:
     """
     Generates a time-based JWT Token with the user ID (subject). 
     """
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = datetime.now(timezone.utc) + (expires_delta or ACCESS_TOKEN_TTL)
     
     to_encode = {"exp": expire, "sub": str(subject)}
     
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, jwt_key, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -33,4 +45,46 @@ def get_password_hash(password: str) -> str:
     """
     It takes the user's password and hashes it (encrypts it) to store it in the database.
     """
-    return pwd_context.hash(password)
\ No newline at end of file
+    return pwd_context.hash(password)
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Returns True if the stored hash uses a deprecated scheme (e.g. bcrypt) or outdated parameters.
+    """
+    return pwd_context.needs_update(hashed_password)
+
+# Process pool for CPU-heavy hashing, created lazily and shut down on app exit.
+_hash_pool: ProcessPoolExecutor | None = None
+
+def _init_hash_worker() -> None:
+    """
+    Loads the hashing backends once per worker so the first request does not pay the import cost.
+    """
+    for scheme in pwd_context.schemes():
+        pwd_context.handler(scheme).get_backend()
+
+def get_hash_pool() -> ProcessPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_hash_worker)
+    return _hash_pool
+
+def shutdown_hash_pool() -> None:
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(wait=False, cancel_futures=True)
+        _hash_pool = None
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Runs verify_password in the hashing process pool so logins don't block the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_pool(), verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Runs get_password_hash in the hashing process pool.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_pool(), get_password_hash, password)
@@ -1,10 +1,11 @@
 from sqlalchemy import (
     Column, Integer, String, ForeignKey, Date, DateTime, Text, 
-    Float, Boolean, JSON, Enum, UniqueConstraint, Index, BigInteger
+    Float, Boolean, JSON, Enum, UniqueConstraint, Index, BigInteger, Uuid, text
+
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC
 from app.core.database import Base
 import enum
 from typing import Optional
@@ -54,7 +55,7 @@ class StorageTier(str, enum.Enum):
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     email = Column(String, unique=True, index=True, nullable=False)
     password_hash = Column(String(255), nullable=False)
     full_name = Column(String(200), nullable=True)
@@ -74,12 +75,13 @@ class User(Base):
     created_presentations = relationship("Presentation", foreign_keys="Presentation.created_by", back_populates="creator")
 
     __table_args__ = (
-        Index('ix_user_active_verified', 'is_active', 'email_verified'),
+        # Partial: only the accounts still waiting for verification are indexed
+        Index('ix_user_unverified_created', 'created_at', postgresql_where=text('is_active AND NOT email_verified')),
     )
 class UserPreference(Base):
     __tablename__ = "user_preferences"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True)
     
     ideal_presentation_time = Column(Integer, default=10)
@@ -94,8 +96,8 @@ class UserPreference(Base):
 class Presentation(Base):
     __tablename__ = "presentations"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
     
     title = Column(String(500), nullable=False)
     original_filename = Column(String(500), nullable=False)
@@ -110,7 +112,7 @@ class Presentation(Base):
     slide_count = Column(Integer, default=0)
     total_words = Column(Integer, default=0)
     
-    status = Column(Enum(PresentationStatus, name="presentation_status_enum"), default=PresentationStatus.UPLOADED, index=True)
+    status = Column(Enum(PresentationStatus, name="presentation_status_enum"), default=PresentationStatus.UPLOADED)
     
     processing_started_at = Column(DateTime(timezone=True), nullable=True)
     processing_completed_at = Column(DateTime(timezone=True), nullable=True)
@@ -135,20 +137,22 @@ class Presentation(Base):
 
     __table_args__ = (
         Index('ix_presentation_status_created', 'status', 'created_at'),
-        Index('ix_presentation_user_created', 'user_id', 'created_at'),
-        Index('ix_presentation_guest_expires', 'is_guest_upload', 'expires_at'),
+        # Covers list_presentations so it can be answered from the index alone
+        Index('ix_presentation_user_created_covering', 'user_id', 'created_at', postgresql_include=['title', 'file_path', 'file_type', 'slide_count', 'status']),
+        # Partial: guest cleanup only ever scans guest uploads, so owned presentations stay out of the index
+        Index('ix_presentation_guest_expires', 'expires_at', postgresql_where=text('is_guest_upload = true')),
     )
 
 class Slide(Base):
     __tablename__ = "slides"
 
-    id = Column(Integer, primary_key=True, index=True)
-    presentation_id = Column(Integer, ForeignKey("presentations.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    presentation_id = Column(Integer, ForeignKey("presentations.id", ondelete="CASCADE"), nullable=False)
     
     page_number = Column(Integer, nullable=False)
     content_text = Column(Text, nullable=True)
     image_path = Column(String, nullable=True)
-    embedding = Column(Vector(1536))
+    embedding = Column(HALFVEC(1536))  # float16 halves index size and scan bandwidth
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -158,18 +162,18 @@ class Slide(Base):
 
     __table_args__ = (
         UniqueConstraint('presentation_id', 'page_number', name='uq_presentation_page'),
-        Index('ix_slide_embedding', 'embedding', postgresql_using='hnsw', postgresql_with={'m': 16, 'ef_construction': 64}, postgresql_ops={'embedding': 'vector_cosine_ops'}),
+        Index('ix_slide_embedding', 'embedding', postgresql_using='hnsw', postgresql_with={'m': 16, 'ef_construction': 64}, postgresql_ops={'embedding': 'halfvec_cosine_ops'}),
     )
 class PresentationSession(Base):
     __tablename__ = "presentation_sessions"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
-    session_uuid = Column(String(36), unique=True, index=True, nullable=False)
+    session_uuid = Column(Uuid, unique=True, index=True, nullable=False)  # native uuid: 16 bytes instead of 36 chars of text
     presentation_id = Column(Integer, ForeignKey("presentations.id", ondelete="CASCADE"), index=True)
     metrics_json = Column(JSON, nullable=True)
 
-    session_type = Column(Enum(SessionType, name="session_type_enum"), nullable=False, index=True)
+    session_type = Column(Enum(SessionType, name="session_type_enum"), nullable=False)
     
     started_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     ended_at = Column(DateTime(timezone=True), nullable=True)
@@ -186,7 +190,7 @@ class PresentationSession(Base):
 class PresentationAnalysis(Base):
     __tablename__ = "presentation_analyses"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     presentation_id = Column(Integer, ForeignKey("presentations.id", ondelete="CASCADE"), unique=True)
     
     overall_score = Column(Float, default=0.0)
@@ -206,8 +210,8 @@ class PresentationAnalysis(Base):
 class Note(Base):
     __tablename__ = "notes"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     slide_id = Column(Integer, ForeignKey("slides.id", ondelete="CASCADE"), nullable=True)
     content = Column(Text, nullable=False)
     
@@ -224,10 +228,10 @@ class Note(Base):
 class VerificationToken(Base):
     __tablename__ = "verification_tokens"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     token = Column(String(128), unique=True, nullable=False, index=True)
-    token_type = Column(Enum(TokenType, name="token_type_enum"), nullable=False, index=True)
+    token_type = Column(Enum(TokenType, name="token_type_enum"), nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
     used_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -242,15 +246,15 @@ class VerificationToken(Base):
 class ActivityLog(Base):
     __tablename__ = "activity_logs"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
-    action = Column(Enum(ActivityAction, name="activity_action_enum"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    action = Column(Enum(ActivityAction, name="activity_action_enum"), nullable=False)
     entity_type = Column(String(50), nullable=True)
     entity_id = Column(Integer, nullable=True)
     ip_address = Column(String(45), nullable=True)
     user_agent = Column(Text, nullable=True)
     log_metadata = Column(JSON, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     user = relationship("User")
     
@@ -258,4 +262,6 @@ class ActivityLog(Base):
         Index('ix_log_user_created', 'user_id', 'created_at'),
         Index('ix_log_action_created', 'action', 'created_at'),
         Index('ix_log_entity', 'entity_type', 'entity_id'),
+        # Rows arrive in created_at order, so a BRIN index covers time ranges at a fraction of a B-tree's size
+        Index('ix_log_created_brin', 'created_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
     )
\ No newline at end of file
@@ -1,9 +1,48 @@
 from email.message import EmailMessage
 from typing import Optional
+import asyncio
 import aiosmtplib
 from app.core.config import settings
 from app.core.logger import logger
 
+# One authenticated SMTP connection shared by all emails, so a burst of resets
+# doesn't pay the TCP + STARTTLS + AUTH handshake per message. Sends are serialized through it.
+_smtp: Optional[aiosmtplib.SMTP] = None
+_smtp_lock = asyncio.Lock()
+
+async def _get_smtp() -> aiosmtplib.SMTP:
+    global _smtp
+    if _smtp is None or not _smtp.is_connected:
+        _smtp = aiosmtplib.SMTP(
+            hostname=settings.SMTP_HOST,
+            port=int(settings.SMTP_PORT),
+            start_tls=True,
+            username=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD,
+        )
+        await _smtp.connect()
+    return _smtp
+
+async def close_smtp() -> None:
+    global _smtp
+    if _smtp is not None:
+        if _smtp.is_connected:
+            try:
+                await _smtp.quit()
+            except aiosmtplib.SMTPException:
+                _smtp.close()
+        _smtp = None
+
+async def _send(message: EmailMessage) -> None:
+    async with _smtp_lock:
+        try:
+            await (await _get_smtp()).send_message(message)
+        except aiosmtplib.SMTPException as e:
+            # Servers drop idle connections; reconnect once and retry
+            logger.warning("SMTP send failed, reconnecting: {}", e)
+            await close_smtp()
+            await (await _get_smtp()).send_message(message)
+
 
 async def send_password_reset_email(to_email: str, token: str) -> bool:
     """Send a simple password reset email containing a link with the token.
@@ -30,16 +69,9 @@ async def send_password_reset_email(to_email: str, token: str) -> bool:
     message.set_content(body)
 
     try:
-        await aiosmtplib.send(
-            message,
-            hostname=settings.SMTP_HOST,
-            port=int(settings.SMTP_PORT),
-            start_tls=True,
-            username=settings.SMTP_USER,
-            password=settings.SMTP_PASSWORD,
-        )
-        logger.info(f"Sent password reset email to {to_email}")
+        await _send(message)
+        logger.info("Sent password reset email to {}", to_email)
         return True
     except Exception as e:
-        logger.error(f"Failed to send password reset email to {to_email}: {e}")
+        logger.error("Failed to send password reset email to {}: {}", to_email, e)
         return False
@@ -1,8 +1,12 @@
 from openai import AsyncOpenAI
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.core.exceptions import EmbeddingError
 from app.core.logger import logger
+from cachetools import LRUCache
 import asyncio
+import hashlib
+import numpy as np
 
 # Lazy initialization of OpenAI client
 _client = None
@@ -15,84 +19,159 @@ def get_client() -> AsyncOpenAI:
     global _client
     if _client is None:
         try:
-            _client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            _client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=get_http_client(),
+                max_retries=EMBEDDING_MAX_RETRIES
+            )
             logger.info("OpenAI client initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize OpenAI client: {str(e)}")
+            logger.error("Failed to initialize OpenAI client: {}", e)
             raise EmbeddingError(
                 message="Failed to initialize OpenAI client",
                 details=str(e)
             )
     return _client
 
+def reset_client() -> None:
+    """
+    Forgets the client so the next call builds a new one around the current shared HTTP client.
+    """
+    global _client
+    _client = None
+
 # Batch processing configuration
-MAX_CONCURRENT_EMBEDDINGS = 10  # Process 10 embeddings at a time
+EMBEDDING_BATCH_SIZE = 16  # Texts sent per embeddings request (API accepts up to 2048)
+EMBEDDING_MAX_CONCURRENCY = 16  # Embeddings requests in flight at once
+EMBEDDING_MAX_RETRIES = 5  # The SDK retries 429s, 5xx and connection errors with backoff, honoring Retry-After
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSIONS = 1536
+
+# Vectors by content hash of the prepared text, so repeated slides and questions skip the API
+_embedding_cache: LRUCache = LRUCache(maxsize=4096)
+
+def _prepare_text(text: str) -> str:
+    """
+    Normalizes text before embedding. Empty text is replaced with a placeholder to avoid API errors.
+    """
+    # isspace() checks for blank text without building a stripped copy; "" needs its own check
+    target_text = text if text and not text.isspace() else "empty slide content"
+    return target_text.replace("\n", " ")
+
+def _cache_key(text: str) -> bytes:
+    return hashlib.blake2b(_prepare_text(text).encode(), digest_size=16).digest()
 
-async def create_embedding(text: str) -> list[float]:
+async def create_embedding(text: str) -> np.ndarray:
     """
     Converts text to a vector. If the text is empty, it vectorizes the word ‘empty’ instead of a space to avoid errors.
     """
+    key = _cache_key(text)
+    cached = _embedding_cache.get(key)
+    if cached is not None:
+        return cached
+
     try:
         client = get_client()
-        target_text = text if text.strip() else "empty slide content"
-        target_text = target_text.replace("\n", " ")
 
         response = await client.embeddings.create(
-            input=target_text,
-            model="text-embedding-3-small"
+            input=_prepare_text(text),
+            model=EMBEDDING_MODEL
         )
-        return response.data[0].embedding
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        # Callers get the cached array itself; read-only so an in-place edit can't corrupt later hits
+        vector.flags.writeable = False
+        _embedding_cache[key] = vector
+        return vector
 
     except Exception as e:
-        logger.error(f"Embedding generation failed: {str(e)}", exc_info=True)
+        logger.error("Embedding generation failed: {}", e, exc_info=True)
         raise EmbeddingError(
             message="Failed to generate text embedding",
             details=str(e)
         )
 
-async def create_embeddings_batch(texts: list[str]) -> list[list[float]]:
+async def create_embeddings(texts: list[str]) -> list[list[float]]:
     """
-    Creates embeddings for multiple texts in parallel with batching.
-    Processes MAX_CONCURRENT_EMBEDDINGS at a time to avoid rate limits.
+    Converts several texts to vectors with a single embeddings request.
     
     Args:
-        texts: List of text strings to embed
+        texts: List of text strings to embed (at most 2048)
         
     Returns:
         List of embedding vectors in the same order as input texts
     """
+    try:
+        client = get_client()
+
+        response = await client.embeddings.create(
+            input=[_prepare_text(text) for text in texts],
+            model=EMBEDDING_MODEL
+        )
+        # The API returns items tagged with their input index
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    except Exception as e:
+        logger.error("Batch embedding request failed: {}", e, exc_info=True)
+        raise EmbeddingError(
+            message="Failed to generate text embeddings",
+            details=str(e)
+        )
+
+async def create_embeddings_batch(texts: list[str]) -> np.ndarray:
+    """
+    Creates embeddings for multiple texts, sending EMBEDDING_BATCH_SIZE texts per request
+    and running up to EMBEDDING_MAX_CONCURRENCY requests in parallel.
+    Texts are grouped by length so each request carries similarly sized inputs.
+    Texts embedded before are served from the in-process cache, and repeated texts are sent once.
+    
+    Args:
+        texts: List of text strings to embed
+        
+    Returns:
+        float32 array of shape (len(texts), EMBEDDING_DIMENSIONS), rows in the same order as input texts
+    """
     if not texts:
-        return []
+        return np.empty((0, EMBEDDING_DIMENSIONS), dtype=np.float32)
     
-    logger.info(f"Starting batch embedding generation for {len(texts)} texts")
+    # Deferred {} formatting: loguru only builds the message if a sink accepts the level
+    logger.info("Starting batch embedding generation for {} texts", len(texts))
 
-    # Process in batches to respect rate limits
-    embeddings = []
+    embeddings = np.empty((len(texts), EMBEDDING_DIMENSIONS), dtype=np.float32)
+    # Positions of each uncached text, so boilerplate slides repeated across a deck are embedded once
+    missing: dict[bytes, list[int]] = {}
+    for i, text in enumerate(texts):
+        key = _cache_key(text)
+        cached = _embedding_cache.get(key)
+        if cached is None:
+            missing.setdefault(key, []).append(i)
+        else:
+            embeddings[i] = cached
 
-    for i in range(0, len(texts), MAX_CONCURRENT_EMBEDDINGS):
-        batch = texts[i:i + MAX_CONCURRENT_EMBEDDINGS]
-        batch_num = (i // MAX_CONCURRENT_EMBEDDINGS) + 1
-        total_batches = (len(texts) + MAX_CONCURRENT_EMBEDDINGS - 1) // MAX_CONCURRENT_EMBEDDINGS
+    # Each distinct text once, longest first, remembering where it came from
+    first_keys = {positions[0]: key for key, positions in missing.items()}
+    order = sorted(first_keys, key=lambda i: len(texts[i]), reverse=True)
+    batches = [
+        order[i:i + EMBEDDING_BATCH_SIZE]
+        for i in range(0, len(order), EMBEDDING_BATCH_SIZE)
+    ]
+    semaphore = asyncio.Semaphore(EMBEDDING_MAX_CONCURRENCY)
 
-        logger.debug(f"Processing batch {batch_num}/{total_batches} ({len(batch)} texts)")
-
-        # Execute batch in parallel
-        batch_embeddings = await asyncio.gather(
-            *[create_embedding(text) for text in batch],
-            return_exceptions=True
-        )
+    async def embed_batch(indices: list[int]) -> None:
+        async with semaphore:
+            vectors = await create_embeddings([texts[i] for i in indices])
+        # Put the vectors back in input order, packed into one contiguous float32 block
+        embeddings[indices] = vectors
+        # Cache as each request lands, so if another batch fails a retried upload only re-sends what is missing
+        for i in indices:
+            # Copy so a cached row doesn't keep the whole matrix alive; read-only like create_embedding's
+            vector = embeddings[i].copy()
+            vector.flags.writeable = False
+            _embedding_cache[first_keys[i]] = vector
 
-        # Check for errors
-        for idx, result in enumerate(batch_embeddings):
-            if isinstance(result, Exception):
-                logger.error(f"Failed to embed text at index {i + idx}: {str(result)}")
-                raise EmbeddingError(
-                    message=f"Batch embedding failed at position {i + idx}",
-                    details=str(result)
-                )
+    await asyncio.gather(*[embed_batch(batch) for batch in batches])
 
-        embeddings.extend(batch_embeddings)
-        logger.debug(f"Completed batch {batch_num}/{total_batches}")
+    for first, *repeats in missing.values():
+        embeddings[repeats] = embeddings[first]
 
-    logger.info(f"Successfully generated {len(embeddings)} embeddings")
-    return embeddings
\ No newline at end of file
+    logger.info("Successfully generated {} embeddings ({} sent to the API)", len(embeddings), len(order))
+    return embeddings
@@ -1,14 +1,32 @@
 """
 File cleanup service for managing old uploaded files.
 """
-from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, delete, and_, or_
 from app.models.presentation import Presentation, PresentationStatus
 from app.core.logger import logger
+import asyncio
 import os
 
+# Ids per bulk DELETE, keeping the IN list well under driver parameter limits
+DELETE_BATCH_SIZE = 1000
+
+def _remove_file(path: str | None, dry_run: bool) -> int | None:
+    """
+    Deletes one file (or only stats it on a dry run) and returns its size,
+    or None if there was no file. Runs in a worker thread.
+    """
+    if not path:
+        return None
+    try:
+        file_size = os.stat(path).st_size
+        if not dry_run:
+            os.remove(path)
+    except FileNotFoundError:
+        return None
+    return file_size
+
 async def cleanup_old_files(
     db: AsyncSession,
     failed_days: int = 7,
@@ -40,78 +58,104 @@ async def cleanup_old_files(
     now = datetime.now(timezone.utc)
     failed_threshold = now - timedelta(days=failed_days)
     
-    # Query 1: Old failed uploads
-    failed_query = select(Presentation).where(
-        and_(
-            Presentation.created_at < failed_threshold,
-            Presentation.status == PresentationStatus.FAILED
-        )
+    # Old failed uploads
+    failed_predicate = and_(
+        Presentation.created_at < failed_threshold,
+        Presentation.status == PresentationStatus.FAILED
     )
-    
-    failed_result = await db.execute(failed_query)
-    failed_presentations = failed_result.scalars().all()
-    
-    # Query 2: Expired guest uploads
-    guest_query = select(Presentation).where(
-        and_(
-            Presentation.is_guest_upload == True,
-            Presentation.expires_at < now
-        )
+    # Expired guest uploads
+    guest_predicate = and_(
+        Presentation.is_guest_upload == True,
+        Presentation.expires_at < now
     )
     
-    guest_result = await db.execute(guest_query)
-    expired_guests = guest_result.scalars().all()
-    
-    presentations_to_delete = list(failed_presentations) + list(expired_guests)
+    # Both sets in one round-trip, selecting only the columns cleanup needs (no ORM objects)
+    cleanup_query = select(
+        Presentation.id,
+        Presentation.file_path,
+        failed_predicate.label("is_failed")
+    ).where(or_(failed_predicate, guest_predicate))
+    
+    result = await db.execute(cleanup_query)
+    presentations_to_delete = result.all()
+    failed_count = sum(1 for p in presentations_to_delete if p.is_failed)
+    guest_count = len(presentations_to_delete) - failed_count
     stats["checked"] = len(presentations_to_delete)
+    ids_to_delete = []
     
-    for presentation in presentations_to_delete:
-        try:
-            # Delete physical file
-            if presentation.file_path and os.path.exists(presentation.file_path):
-                file_size = os.path.getsize(presentation.file_path)
-                
-                if not dry_run:
-                    os.remove(presentation.file_path)
-                    logger.info(f"Deleted file: {presentation.file_path}")
-                else:
-                    logger.info(f"[DRY RUN] Would delete: {presentation.file_path}")
-                
-                stats["deleted_files"] += 1
-                stats["freed_bytes"] += file_size
-            
-            # Delete database record
+    # Delete physical files concurrently in worker threads so the event loop never waits on the filesystem
+    removals = await asyncio.gather(
+        *(asyncio.to_thread(_remove_file, p.file_path, dry_run) for p in presentations_to_delete),
+        return_exceptions=True
+    )
+    
+    for presentation, file_size in zip(presentations_to_delete, removals):
+        if isinstance(file_size, Exception):
+            logger.error(f"Error deleting presentation {presentation.id}: {str(file_size)}")
+            stats["errors"] += 1
+            continue
+        
+        if file_size is not None:
             if not dry_run:
-                await db.delete(presentation)
-                stats["deleted_records"] += 1
+                logger.info(f"Deleted file: {presentation.file_path}")
             else:
-                logger.info(f"[DRY RUN] Would delete record: ID={presentation.id}")
-                stats["deleted_records"] += 1
-                
-        except Exception as e:
-            logger.error(f"Error deleting presentation {presentation.id}: {str(e)}")
-            stats["errors"] += 1
+                logger.info(f"[DRY RUN] Would delete: {presentation.file_path}")
+            
+            stats["deleted_files"] += 1
+            stats["freed_bytes"] += file_size
+        
+        # Database records are removed in bulk below
+        if dry_run:
+            logger.info(f"[DRY RUN] Would delete record: ID={presentation.id}")
+        ids_to_delete.append(presentation.id)
+        stats["deleted_records"] += 1
     
     if not dry_run:
+        # One DELETE per batch instead of one per row; ON DELETE CASCADE foreign keys remove slides and sessions
+        for start in range(0, len(ids_to_delete), DELETE_BATCH_SIZE):
+            batch = ids_to_delete[start:start + DELETE_BATCH_SIZE]
+            await db.execute(delete(Presentation).where(Presentation.id.in_(batch)))
         await db.commit()
     
     logger.info(
         f"Cleanup {'simulation' if dry_run else 'completed'}: "
         f"{stats['deleted_files']} files "
-        f"({stats['deleted_records']} records: {len(failed_presentations)} failed uploads, "
-        f"{len(expired_guests)} expired guests), "
+        f"({stats['deleted_records']} records: {failed_count} failed uploads, "
+        f"{guest_count} expired guests), "
         f"{stats['freed_bytes'] / (1024*1024):.2f}MB freed. "
         f"User uploads are never auto-deleted."
     )
     
     return stats
 
-async def cleanup_orphaned_files(upload_dir: str = "uploaded_files") -> dict:
+def _iter_files(root: str):
+    """
+    Yields a DirEntry for every regular file under root. DirEntry caches its stat,
+    so callers get sizes and mtimes without another syscall per file.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+async def cleanup_orphaned_files(
+    db: AsyncSession,
+    upload_dir: str = "uploaded_files",
+    min_age_minutes: int = 60,
+    dry_run: bool = False
+) -> dict:
     """
     Removes files from disk that don't have corresponding database records.
+    Files modified within min_age_minutes are skipped, since an upload is written
+    to disk before its presentation row is committed.
     
     Args:
+        db: Database session
         upload_dir: Directory containing uploaded files
+        min_age_minutes: Leave files younger than this alone (default: 60 minutes)
+        dry_run: If True, only report what would be deleted without deleting
         
     Returns:
         dict: Statistics about cleanup
@@ -123,17 +167,57 @@ async def cleanup_orphaned_files(upload_dir: str = "uploaded_files") -> dict:
         "freed_bytes": 0
     }
     
-    upload_path = Path(upload_dir)
-    if not upload_path.exists():
+    if not os.path.isdir(upload_dir):
         logger.warning(f"Upload directory does not exist: {upload_dir}")
         return stats
     
-    # Get all files in upload directory
-    all_files = list(upload_path.glob("**/*.*"))
-    stats["checked"] = len(all_files)
+    # Every stored path in one query, compared as absolute paths in a set
+    result = await db.execute(select(Presentation.file_path))
+    known_paths = {os.path.abspath(path) for path in result.scalars()}
+    cutoff = (datetime.now(timezone.utc) - timedelta(minutes=min_age_minutes)).timestamp()
+    orphans = []
+    
+    for entry in _iter_files(upload_dir):
+        stats["checked"] += 1
+        if os.path.abspath(entry.path) in known_paths:
+            continue
+        
+        try:
+            file_stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        if file_stat.st_mtime <= cutoff:
+            orphans.append((entry.path, file_stat.st_size))
     
-    # This function should be called with database session
-    # For now, just log orphaned files
-    logger.info(f"Found {len(all_files)} files in {upload_dir}")
+    stats["orphaned"] = len(orphans)
+    if not dry_run:
+        # Sizes come from the scan, so the worker threads only need to unlink
+        removals = await asyncio.gather(
+            *(asyncio.to_thread(os.remove, path) for path, _ in orphans),
+            return_exceptions=True
+        )
+    else:
+        removals = [None] * len(orphans)
+    
+    for (path, file_size), error in zip(orphans, removals):
+        if isinstance(error, FileNotFoundError):
+            continue
+        if isinstance(error, Exception):
+            logger.error(f"Error deleting orphaned file {path}: {str(error)}")
+            continue
+        
+        if not dry_run:
+            logger.info(f"Deleted orphaned file: {path}")
+        else:
+            logger.info(f"[DRY RUN] Would delete orphaned file: {path}")
+        
+        stats["deleted"] += 1
+        stats["freed_bytes"] += file_size
+    
+    logger.info(
+        f"Orphan cleanup {'simulation' if dry_run else 'completed'}: "
+        f"{stats['orphaned']} of {stats['checked']} files in {upload_dir} had no database record, "
+        f"{stats['freed_bytes'] / (1024*1024):.2f}MB freed."
+    )
     
     return stats
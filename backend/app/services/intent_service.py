@@ -2,8 +2,10 @@ from enum import Enum
 from typing import Optional, Dict, Any
 import json
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.core.logger import logger
 from openai import AsyncOpenAI
+from functools import lru_cache
 
 class IntentType(str, Enum):
     NEXT_SLIDE = "NEXT_SLIDE"
@@ -27,26 +29,55 @@ class IntentResult:
             "original_text": self.original_text
         }
 
+# Bare navigation commands that need no LLM round-trip. Only an exact match of the whole
+# (normalized) utterance counts, so these words inside longer speech still go to the model.
+NEXT_COMMANDS = frozenset({
+    "next", "next slide", "next page", "go forward",
+    "sonraki", "sonraki slayt", "sonraki sayfa", "sonraki slayta geç", "ileri", "ileri geçelim",
+})
+PREVIOUS_COMMANDS = frozenset({
+    "back", "go back", "previous", "previous slide", "previous page",
+    "geri", "geri dön", "önceki", "önceki slayt", "önceki sayfa", "önceki slayta dön",
+})
+_STRIP_PUNCTUATION = str.maketrans("", "", ".,!?;:")
+
+def _normalize_command(text: str) -> str:
+    # Turkish "İ" lowercases to "i" + combining dot; drop the dot so "İleri" == "ileri"
+    text = text.lower().replace("\u0307", "").translate(_STRIP_PUNCTUATION)
+    return " ".join(text.split())
+
+def match_command(text: str, current_slide: int = 1, total_slides: int = 1) -> Optional[IntentResult]:
+    """
+    Returns a navigation intent if the transcript is exactly a known bare command, otherwise None.
+    """
+    command = _normalize_command(text)
+    if command in NEXT_COMMANDS:
+        # Clamped like PREVIOUS below: on the last slide the target is the current slide, which the
+        # orchestration worker drops instead of broadcasting a command without a target
+        return IntentResult(IntentType.NEXT_SLIDE, 1.0, slide_number=min(current_slide + 1, total_slides), original_text=text)
+    if command in PREVIOUS_COMMANDS:
+        return IntentResult(IntentType.PREVIOUS_SLIDE, 1.0, slide_number=max(1, current_slide - 1), original_text=text)
+    return None
+
 _client = None
 
 def get_client() -> AsyncOpenAI:
     global _client
     if _client is None:
-        _client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        _client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, http_client=get_http_client())
     return _client
 
-async def analyze_intent(text: str, current_slide: int = 1, total_slides: int = 1) -> IntentResult:
+def reset_client() -> None:
+    global _client
+    _client = None
+
+@lru_cache(maxsize=256)
+def _build_system_prompt(current_slide: int, total_slides: int) -> str:
     """
-    Analyzes the user's speech transcript to detect presentation-related intents.
-    Supports both English and Turkish voice commands.
-    Uses the current slide and total slides as context.
+    Builds the intent system prompt for a slide position. The text only depends on the
+    two numbers, so it is formatted once per position instead of on every transcript.
     """
-    if not text.strip():
-        return IntentResult(IntentType.UNKNOWN, 0.0)
-
-    client = get_client()
-    
-    system_prompt = f"""
+    return f"""
     You are an AI Presentation Assistant. Your job is to analyze the speaker's transcript and identify if they want to navigate the presentation.
     The speaker may use either English or Turkish. You must understand commands in both languages equally well.
     
@@ -129,6 +160,22 @@ async def analyze_intent(text: str, current_slide: int = 1, total_slides: int =
     Only provide the JSON.
     """
 
+async def analyze_intent(text: str, current_slide: int = 1, total_slides: int = 1) -> IntentResult:
+    """
+    Analyzes the user's speech transcript to detect presentation-related intents.
+    Supports both English and Turkish voice commands.
+    Uses the current slide and total slides as context.
+    """
+    if not text.strip():
+        return IntentResult(IntentType.UNKNOWN, 0.0)
+
+    command_result = match_command(text, current_slide, total_slides)
+    if command_result is not None:
+        return command_result
+
+    client = get_client()
+    system_prompt = _build_system_prompt(current_slide, total_slides)
+
     try:
         response = await client.chat.completions.create(
             model="gpt-4o-mini",
@@ -1,23 +1,32 @@
 import pypdf
 from fastapi import UploadFile
 from app.core.exceptions import PDFExtractionError, ValidationError
+from app.core.executors import get_extraction_pool
 from app.core.logger import logger
+from contextlib import contextmanager
+import asyncio
 import re
 
 # Security limits
 MAX_PDF_PAGES = 500
 MAX_PAGE_SIZE_KB = 5000  # 5MB per page
 
+# Parallel extraction: below this size the process hop costs more than it saves
+PARALLEL_EXTRACTION_MIN_SIZE = 2 * 1024 * 1024
+PAGES_PER_TASK = 16
+
+# Null bytes and other control characters except newlines and tabs
+CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f-\x9f]')
+WHITESPACE_RUNS = re.compile(r'\s+')
+
 def clean_text(text: str) -> str:
     """
     Cleans extracted PDF text by removing null bytes and other invalid characters.
     """
-    # Remove null bytes
-    text = text.replace('\x00', '')
-    # Remove other control characters except newlines and tabs
-    text = re.sub(r'[\x01-\x08\x0b-\x0c\x0e-\x1f\x7f-\x9f]', '', text)
+    # Remove control characters (null bytes included)
+    text = CONTROL_CHARS.sub('', text)
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_RUNS.sub(' ', text)
     return text.strip()
 
 def validate_pdf_security(pdf_reader: pypdf.PdfReader, file_size: int) -> None:
@@ -59,29 +68,99 @@ async def extract_text_from_pdf(file: UploadFile, file_size: int = 0) -> list[st
         file: Uploaded PDF file
         file_size: File size in bytes (for security validation)
     """
-    try:
-        pdf_reader = pypdf.PdfReader(file.file)
-        
-        if len(pdf_reader.pages) == 0:
-            raise PDFExtractionError("PDF file has no pages")
-        
-        # Security validation
-        validate_pdf_security(pdf_reader, file_size)
-        
-        slides_text = []
+    return _extract_pages(file.file, file_size)
+
+async def extract_text_from_pdf_path(file_path: str, file_size: int = 0) -> list[str]:
+    """
+    Same as extract_text_from_pdf, but reads the PDF that has already been saved to disk.
+    Parsing runs in the process pool so it never blocks the event loop; large files are
+    additionally split into page ranges that are extracted in parallel.
+    
+    Args:
+        file_path: Path to the saved PDF file
+        file_size: File size in bytes (for security validation)
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_extraction_pool()
+    if file_size < PARALLEL_EXTRACTION_MIN_SIZE:
+        return await loop.run_in_executor(pool, _extract_pages_from_path, file_path, file_size)
+
+    num_pages = await loop.run_in_executor(pool, _validated_page_count, file_path, file_size)
+    with _pdf_errors():
+        chunks = await asyncio.gather(*[
+            loop.run_in_executor(pool, _extract_page_range, file_path, start, min(start + PAGES_PER_TASK, num_pages))
+            for start in range(0, num_pages, PAGES_PER_TASK)
+        ])
+    logger.debug(f"Extracted {num_pages} pages in {len(chunks)} parallel tasks")
+    return [text for chunk in chunks for text in chunk]
+
+def _extract_pages(stream, file_size: int) -> list[str]:
+    """
+    Extracts cleaned text for every page of a PDF from a binary stream.
+    """
+    with _pdf_errors():
+        pdf_reader = _open_reader(stream, file_size)
+        return _page_texts(pdf_reader, 0, len(pdf_reader.pages))
+
+def _extract_pages_from_path(file_path: str, file_size: int) -> list[str]:
+    """
+    Extracts every page of a PDF on disk. Runs in a worker process.
+    """
+    with open(file_path, "rb") as f:
+        return _extract_pages(f, file_size)
+
+def _validated_page_count(file_path: str, file_size: int) -> int:
+    """
+    Runs the security checks on a PDF on disk and returns its page count. Runs in a worker process.
+    """
+    with _pdf_errors(), open(file_path, "rb") as f:
+        return len(_open_reader(f, file_size).pages)
+
+def _extract_page_range(file_path: str, start: int, end: int) -> list[str]:
+    """
+    Extracts pages [start, end) of an already validated PDF. Runs in a worker process.
+    """
+    with open(file_path, "rb") as f:
+        return _page_texts(pypdf.PdfReader(f), start, end)
+
+def _open_reader(stream, file_size: int) -> pypdf.PdfReader:
+    """
+    Opens a PDF and runs the security checks on it.
+    """
+    pdf_reader = pypdf.PdfReader(stream)
+    
+    if len(pdf_reader.pages) == 0:
+        raise PDFExtractionError("PDF file has no pages")
+    
+    # Security validation
+    validate_pdf_security(pdf_reader, file_size)
+    return pdf_reader
+
+def _page_texts(pdf_reader: pypdf.PdfReader, start: int, end: int) -> list[str]:
+    """
+    Returns cleaned text for pages [start, end); pages that fail to extract become empty strings.
+    """
+    slides_text = []
+    
+    for i in range(start, end):
+        try:
+            text = pdf_reader.pages[i].extract_text() or "" # if no text, return empty string
+            cleaned_text = clean_text(text)
+            slides_text.append(cleaned_text)
+            logger.debug(f"Extracted page {i + 1}/{len(pdf_reader.pages)}")
+        except Exception as e:
+            logger.warning(f"Failed to extract page {i + 1}: {str(e)}")
+            slides_text.append("")  # Add empty string for failed pages
         
-        for i, page in enumerate(pdf_reader.pages, 1):
-            try:
-                text = page.extract_text() or "" # if no text, return empty string
-                cleaned_text = clean_text(text)
-                slides_text.append(cleaned_text)
-                logger.debug(f"Extracted page {i}/{len(pdf_reader.pages)}")
-            except Exception as e:
-                logger.warning(f"Failed to extract page {i}: {str(e)}")
-                slides_text.append("")  # Add empty string for failed pages
-            
-        return slides_text
+    return slides_text
 
+@contextmanager
+def _pdf_errors():
+    """
+    Converts any failure while reading a PDF into a PDFExtractionError.
+    """
+    try:
+        yield
     except pypdf.errors.PdfReadError as e:
         logger.error(f"PDF Read Error: {str(e)}")
         raise PDFExtractionError(
@@ -93,4 +172,4 @@ async def extract_text_from_pdf(file: UploadFile, file_size: int = 0) -> list[st
         raise PDFExtractionError(
             message="Failed to extract text from PDF",
             details=str(e)
-        )
\ No newline at end of file
+        )
@@ -4,24 +4,27 @@ PPTX text extraction service with security validation.
 from pptx import Presentation
 from fastapi import UploadFile
 from app.core.exceptions import FileProcessingError, ValidationError
+from app.core.executors import get_extraction_pool
 from app.core.logger import logger
+import asyncio
 import re
-import io
 
 # Security limits (same as PDF)
 MAX_PPTX_SLIDES = 500
 MAX_SLIDE_SIZE_KB = 5000  # 5MB per slide
 
+# Null bytes and other control characters except newlines and tabs
+CONTROL_CHARS = re.compile(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f-\x9f]')
+WHITESPACE_RUNS = re.compile(r'\s+')
+
 def clean_text(text: str) -> str:
     """
     Cleans extracted PPTX text by removing null bytes and other invalid characters.
     """
-    # Remove null bytes
-    text = text.replace('\x00', '')
-    # Remove other control characters except newlines and tabs
-    text = re.sub(r'[\x01-\x08\x0b-\x0c\x0e-\x1f\x7f-\x9f]', '', text)
+    # Remove control characters (null bytes included)
+    text = CONTROL_CHARS.sub('', text)
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_RUNS.sub(' ', text)
     return text.strip()
 
 def validate_pptx_security(prs: Presentation, file_size: int) -> None:
@@ -61,13 +64,27 @@ async def extract_text_from_pptx(file: UploadFile, file_size: int = 0) -> list[s
     Returns:
         List of text strings, one per slide
     """
+    # Load presentation straight from the spooled upload (no in-memory copy)
+    return _extract_slides(file.file, file_size)
+
+async def extract_text_from_pptx_path(file_path: str, file_size: int = 0) -> list[str]:
+    """
+    Same as extract_text_from_pptx, but reads the PPTX that has already been saved to disk.
+    Parsing runs in the process pool so it never blocks the event loop.
+    
+    Args:
+        file_path: Path to the saved PPTX file
+        file_size: File size in bytes (for security validation)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_extraction_pool(), _extract_slides, file_path, file_size)
+
+def _extract_slides(source, file_size: int) -> list[str]:
+    """
+    Extracts cleaned text and speaker notes for every slide of a PPTX from a path or binary stream.
+    """
     try:
-        # Read file content into memory
-        file_content = await file.read()
-        file_bytes = io.BytesIO(file_content)
-        
-        # Load presentation
-        prs = Presentation(file_bytes)
+        prs = Presentation(source)
         
         if len(prs.slides) == 0:
             raise FileProcessingError("PPTX file has no slides")
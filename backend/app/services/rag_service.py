@@ -1,13 +1,20 @@
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.models.presentation import Slide
+from sqlalchemy import select, literal, union_all, func
+from app.models.presentation import Presentation, Slide
 from app.services import embedding_service
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.core.logger import logger
 from app.core.exceptions import EmbeddingError
 from openai import AsyncOpenAI
 
+# The HNSW index on slides.embedding is shared by all presentations and the presentation_id filter
+# is applied to its candidates, so a plain scan stops after ef_search rows that may all belong to other
+# decks. Iterative scans (pgvector >= 0.8, checked by migration 0008) keep walking the graph until the LIMIT is filled.
+HNSW_EF_SEARCH = 100
+HNSW_ITERATIVE_SCAN = "relaxed_order"
+
 # Lazy initialization of OpenAI client
 _client = None
 
@@ -19,7 +26,7 @@ def get_client() -> AsyncOpenAI:
     global _client
     if _client is None:
         try:
-            _client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            _client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, http_client=get_http_client())
             logger.info("OpenAI client initialized successfully in RAG service")
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client in RAG service: {str(e)}")
@@ -29,50 +36,64 @@ def get_client() -> AsyncOpenAI:
             )
     return _client
 
+def reset_client() -> None:
+    """Forgets the client; used on shutdown once the shared HTTP client is closed."""
+    global _client
+    _client = None
+
 async def ask_question(
     db: AsyncSession, 
-    presentation_id: int, 
+    presentation: Presentation, 
     question: str,
-    current_slide: Optional[int] = None,
-    presentation_title: str = "",
-    total_slides: int = 0
+    current_slide: Optional[int] = None
 ) -> dict:
     """
     1. Converts the question into a vector.
     2. Finds the 3 most relevant slides.
     3. Sends context to GPT-4o-mini with instructions to match the user's language.
     """
-    
+    presentation_id = presentation.id
+    presentation_title = presentation.title
+    total_slides = presentation.slide_count or 0
+
     # 1. Embedding
     query_vector = await embedding_service.create_embedding(question)
 
     # 2. Vector Search + Current Slide Context
-    top_slides = []
-    
-    # Always include the current slide if provided
-    if current_slide:
-        current_stmt = select(Slide).filter(
-            Slide.presentation_id == presentation_id,
-            Slide.page_number == current_slide
-        )
-        current_res = await db.execute(current_stmt)
-        curr_slide_obj = current_res.scalar_one_or_none()
-        if curr_slide_obj:
-            top_slides.append(curr_slide_obj)
+    # Cosine distance so the planner can use the halfvec_cosine_ops HNSW index on slides.embedding;
+    # OpenAI embeddings are unit length, so the ranking is the same as with L2
+    distance = Slide.embedding.cosine_distance(query_vector).label("distance")
 
-    # Fetch nearest neighbors (excluding current slide if already added)
-    search_stmt = select(Slide).filter(
+    # Fetch nearest neighbors (excluding the current slide, which is added separately)
+    # Only the columns the prompt uses; the 1536-dim embedding never leaves Postgres
+    search_stmt = select(Slide.page_number, Slide.content_text, literal(1).label("prio"), distance).filter(
         Slide.presentation_id == presentation_id
     )
     if current_slide:
         search_stmt = search_stmt.filter(Slide.page_number != current_slide)
-    
-    search_stmt = search_stmt.order_by(
-        Slide.embedding.l2_distance(query_vector)
-    ).limit(3 - len(top_slides))
-    
+    search_stmt = search_stmt.order_by(distance).limit(3)
+
+    candidates = search_stmt
+    if current_slide:
+        # Always include the current slide: point lookup and ANN search in one round-trip
+        current_stmt = select(Slide.page_number, Slide.content_text, literal(0).label("prio"), distance).filter(
+            Slide.presentation_id == presentation_id,
+            Slide.page_number == current_slide
+        )
+        candidates = union_all(current_stmt, search_stmt)
+    # relaxed_order can hand back neighbours slightly out of order, so sort the candidates again
+    rows = candidates.subquery()
+    search_stmt = select(rows.c.page_number, rows.c.content_text).order_by(rows.c.prio, rows.c.distance).limit(3)
+
+    if db.get_bind().dialect.name == "postgresql":
+        # Transaction-local, so pooled connections go back with the server defaults
+        await db.execute(select(
+            func.set_config("hnsw.iterative_scan", HNSW_ITERATIVE_SCAN, True),
+            func.set_config("hnsw.ef_search", str(HNSW_EF_SEARCH), True)
+        ))
+
     result = await db.execute(search_stmt)
-    top_slides.extend(result.scalars().all())
+    top_slides = result.all()
 
     if not top_slides:
         return {
@@ -1,6 +1,8 @@
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.presentation import Presentation, Slide, PresentationStatus, FileType
 from datetime import datetime, timezone
+import numpy as np
 import os
 
 async def save_presentation_with_slides(
@@ -9,7 +11,7 @@ async def save_presentation_with_slides(
     title: str, 
     file_path: str,
     slide_texts: list[str], 
-    embeddings: list[list[float]],
+    embeddings: np.ndarray | list[list[float]],
     file_hash: str = None
 ):
     presentation = None
@@ -39,17 +41,18 @@ async def save_presentation_with_slides(
         if len(slide_texts) != len(embeddings):
              raise ValueError("The number of slide texts and embeddings do not match!")
         
-        # Create slides with embeddings
-        slide_objects = [
-            Slide(
-                presentation_id=presentation.id, 
-                page_number=i + 1,
-                content_text=text,
-                embedding=vector 
-            )
+        # Insert all slides with embeddings in one multi-row INSERT instead of one per slide
+        slide_rows = [
+            {
+                "presentation_id": presentation.id,
+                "page_number": i + 1,
+                "content_text": text,
+                "embedding": vector
+            }
             for i, (text, vector) in enumerate(zip(slide_texts, embeddings))
         ]
-        db.add_all(slide_objects)
+        if slide_rows:
+            await db.execute(insert(Slide), slide_rows)
         
         # Update status to COMPLETED
         presentation.status = PresentationStatus.COMPLETED
@@ -1,4 +1,6 @@
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.staticfiles import StaticFiles
@@ -8,6 +10,8 @@ from sqlalchemy import text
 
 from app.core.config import settings
 from app.core.database import engine
+from app.core.http_client import close_http_client
+from app.core import executors, security
 from app.core.logger import logger
 from app.core.exceptions import (
     AppBaseException,
@@ -19,6 +23,7 @@ from app.core.exceptions import (
     ValidationError
 )
 from app.api.v1 import auth, presentations, chat, orchestration
+from app.services import email_service, embedding_service, intent_service, rag_service
 
 # Lifespan event to create tables and extensions
 @asynccontextmanager
@@ -35,8 +40,22 @@ async def lifespan(app: FastAPI):
             logger.warning("Application is starting without confirming extension setup.")
     else:
         logger.info("Skipping database initialization in TESTING mode")
+    # Larger default executor so concurrent uploads don't queue behind each other's file I/O
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=settings.THREAD_POOL_SIZE))
+    orchestration.start_slide_flusher()
     yield
+    await orchestration.stop_slide_flusher()
+    security.shutdown_hash_pool()
+    executors.shutdown_extraction_pool()
+    await close_http_client()
+    # The cached OpenAI clients wrap the closed HTTP client; drop them so a restarted app builds new ones
+    embedding_service.reset_client()
+    intent_service.reset_client()
+    rag_service.reset_client()
+    await email_service.close_smtp()
     logger.info("Application shutdown")
+    # Drain the enqueued log sinks before the process exits
+    await logger.complete()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
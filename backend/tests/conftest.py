@@ -29,8 +29,8 @@ TestingSessionLocal = async_sessionmaker(
 
 # 3. Import app and dependencies AFTER environment setup
 from main import app
-from app.api.v1.auth import get_db
-from app.core.database import Base
+from app.core import executors
+from app.core.database import Base, get_db
 
 # Event loop fixture for session scope
 @pytest.fixture(scope="session")
@@ -43,6 +43,13 @@ def event_loop():
 @pytest_asyncio.fixture(scope="function", autouse=True)
 async def setup_database():
     """Setup and teardown database for each test"""
+    # Ids restart with every fresh schema, so drop cached auth state too
+    from app.api.v1 import auth
+    auth._jwt_cache.clear()
+    auth._user_cache.clear()
+    from app.services import embedding_service
+    embedding_service._embedding_cache.clear()
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
@@ -65,16 +72,8 @@ async def client(db_session):
     async def override_get_db():
         yield db_session
     
-    # Override all get_db dependencies
+    # All routers share app.core.database.get_db
     app.dependency_overrides[get_db] = override_get_db
-    
-    try:
-        from app.api.v1.presentations import get_db as pres_get_db
-        from app.api.v1.chat import get_db as chat_get_db
-        app.dependency_overrides[pres_get_db] = override_get_db
-        app.dependency_overrides[chat_get_db] = override_get_db
-    except ImportError:
-        pass  # These modules might not exist yet
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
@@ -102,3 +101,4 @@ def sync_client(db_session):
 def pytest_sessionfinish(session, exitstatus):
     """Cleanup after all tests are done"""
     asyncio.run(engine.dispose())
+    executors.shutdown_extraction_pool()
@@ -59,3 +59,50 @@ async def test_login_invalid_credentials(client: AsyncClient):
     )
     assert response.status_code == 401
     assert response.json()["detail"] == "Wrong email or password."
+
+@pytest.mark.asyncio
+async def test_get_me_reuses_token(client: AsyncClient):
+    """Test that the same bearer token authenticates repeated requests"""
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "me@example.com",
+            "password": "testpassword123",
+            "password_confirm": "testpassword123",
+            "full_name": "Me User",
+            "birth_date": "1990-01-01"
+        }
+    )
+    login = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "me@example.com", "password": "testpassword123"}
+    )
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    for _ in range(2):
+        response = await client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["email"] == "me@example.com"
+
+@pytest.mark.asyncio
+async def test_get_me_invalid_token(client: AsyncClient):
+    """Test that an invalid bearer token is rejected"""
+    response = await client.get("/api/v1/auth/me", headers={"Authorization": "Bearer not-a-jwt"})
+    assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_register_duplicate_email(client: AsyncClient):
+    """Test that registering an existing email is rejected"""
+    payload = {
+        "email": "dup@example.com",
+        "password": "testpassword123",
+        "password_confirm": "testpassword123",
+        "full_name": "Dup User",
+        "birth_date": "1990-01-01"
+    }
+    first = await client.post("/api/v1/auth/register", json=payload)
+    assert first.status_code == 200
+
+    second = await client.post("/api/v1/auth/register", json=payload)
+    assert second.status_code == 400
+    assert second.json()["detail"] == "This email is already registered."
@@ -0,0 +1,25 @@
+import pytest
+from httpx import AsyncClient
+from tests.test_presentations import auth_headers
+
+@pytest.mark.asyncio
+async def test_chat_rejects_overlong_question(client: AsyncClient):
+    """Test that questions over the 500 character limit never reach the RAG service"""
+    headers = await auth_headers(client)
+    response = await client.post(
+        "/api/v1/chat/1",
+        json={"question": "x" * 501},
+        headers=headers
+    )
+    assert response.status_code == 422
+
+@pytest.mark.asyncio
+async def test_chat_unknown_presentation(client: AsyncClient):
+    """Test that asking about a presentation the user does not own returns 404"""
+    headers = await auth_headers(client)
+    response = await client.post(
+        "/api/v1/chat/999",
+        json={"question": "What is this about?"},
+        headers=headers
+    )
+    assert response.status_code == 404
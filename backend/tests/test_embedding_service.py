@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, patch
+from app.services import embedding_service
+
+@pytest.mark.asyncio
+async def test_create_embeddings_batch_keeps_input_order():
+    """Test that length-sorted batching returns a float32 matrix with rows in the original order"""
+    texts = [f"slide {i} " + "x" * (i * 7 % 23) for i in range(40)]
+    dimensions = embedding_service.EMBEDDING_DIMENSIONS
+    fake_embeddings = AsyncMock(side_effect=lambda batch: [[float(texts.index(text))] * dimensions for text in batch])
+
+    with patch("app.services.embedding_service.create_embeddings", fake_embeddings):
+        embeddings = await embedding_service.create_embeddings_batch(texts)
+
+    assert embeddings.dtype == np.float32
+    assert embeddings.shape == (len(texts), dimensions)
+    assert embeddings[:, 0].tolist() == list(range(len(texts)))
+    # 40 texts split into requests of at most EMBEDDING_BATCH_SIZE
+    assert fake_embeddings.await_count == 3
+    for call in fake_embeddings.await_args_list:
+        batch = call.args[0]
+        assert len(batch) <= embedding_service.EMBEDDING_BATCH_SIZE
+
+@pytest.mark.asyncio
+async def test_create_embeddings_batch_serves_repeated_texts_from_cache():
+    """Test that texts embedded once are not sent to the API again"""
+    dimensions = embedding_service.EMBEDDING_DIMENSIONS
+    fake_embeddings = AsyncMock(side_effect=lambda batch: [[float(len(text))] * dimensions for text in batch])
+
+    with patch("app.services.embedding_service.create_embeddings", fake_embeddings):
+        first = await embedding_service.create_embeddings_batch(["Intro", "Results"])
+        second = await embedding_service.create_embeddings_batch(["Results", "Summary", "Intro"])
+
+    assert fake_embeddings.await_args_list[1].args[0] == ["Summary"]
+    assert second[0].tolist() == first[1].tolist()
+    assert second[2].tolist() == first[0].tolist()
+    assert second[1, 0] == float(len("Summary"))
+
+@pytest.mark.asyncio
+async def test_create_embeddings_batch_sends_repeated_texts_once():
+    """Test that identical slides in one deck share a single API input"""
+    texts = ["Agenda", "Thank you", "Agenda", "Questions?", "Thank you"]
+    dimensions = embedding_service.EMBEDDING_DIMENSIONS
+    fake_embeddings = AsyncMock(side_effect=lambda batch: [[float(len(text))] * dimensions for text in batch])
+
+    with patch("app.services.embedding_service.create_embeddings", fake_embeddings):
+        embeddings = await embedding_service.create_embeddings_batch(texts)
+
+    sent = [text for call in fake_embeddings.await_args_list for text in call.args[0]]
+    assert sorted(sent) == ["Agenda", "Questions?", "Thank you"]
+    assert embeddings[:, 0].tolist() == [float(len(text)) for text in texts]
+
+@pytest.mark.asyncio
+async def test_create_embeddings_batch_caches_batches_that_succeeded():
+    """Test that a failed request doesn't throw away the batches that already came back"""
+    texts = [f"slide {i}" for i in range(embedding_service.EMBEDDING_BATCH_SIZE + 1)]
+    dimensions = embedding_service.EMBEDDING_DIMENSIONS
+
+    async def flaky_embeddings(batch):
+        if len(batch) == 1:
+            raise embedding_service.EmbeddingError(message="Failed to generate text embeddings")
+        return [[1.0] * dimensions for _ in batch]
+
+    with patch("app.services.embedding_service.create_embeddings", AsyncMock(side_effect=flaky_embeddings)):
+        with pytest.raises(embedding_service.EmbeddingError):
+            await embedding_service.create_embeddings_batch(texts)
+
+    retry = AsyncMock(side_effect=lambda batch: [[2.0] * dimensions for _ in batch])
+    with patch("app.services.embedding_service.create_embeddings", retry):
+        await embedding_service.create_embeddings_batch(texts)
+
+    assert retry.await_count == 1
+    assert len(retry.await_args_list[0].args[0]) == 1
+
+@pytest.mark.asyncio
+async def test_cached_embeddings_are_read_only():
+    """Test that a caller editing a returned vector in place can't corrupt the cache"""
+    dimensions = embedding_service.EMBEDDING_DIMENSIONS
+    fake_embeddings = AsyncMock(side_effect=lambda batch: [[3.0] * dimensions for _ in batch])
+
+    with patch("app.services.embedding_service.create_embeddings", fake_embeddings):
+        await embedding_service.create_embeddings_batch(["Agenda"])
+
+    vector = await embedding_service.create_embedding("Agenda")
+    with pytest.raises(ValueError):
+        vector /= np.linalg.norm(vector)
+    assert (await embedding_service.create_embedding("Agenda"))[0] == 3.0
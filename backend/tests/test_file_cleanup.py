@@ -0,0 +1,94 @@
+import os
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
+from app.models.presentation import Presentation, PresentationStatus, FileType
+from app.services import file_cleanup
+
+def make_presentation(path, **fields) -> Presentation:
+    """Build a presentation row backed by a small file on disk"""
+    path.write_bytes(b"x" * 10)
+    return Presentation(
+        title=path.name,
+        original_filename=path.name,
+        file_type=FileType.PDF,
+        file_path=str(path),
+        file_size_bytes=10,
+        **fields
+    )
+
+@pytest.mark.asyncio
+async def test_cleanup_old_files_removes_failed_and_expired_guest_uploads(db_session, tmp_path):
+    """Test that old failed and expired guest uploads are deleted while user uploads are kept"""
+    now = datetime.now(timezone.utc)
+    failed = make_presentation(tmp_path / "failed.pdf", status=PresentationStatus.FAILED, created_at=now - timedelta(days=30))
+    guest = make_presentation(tmp_path / "guest.pdf", is_guest_upload=True, expires_at=now - timedelta(hours=1))
+    kept = make_presentation(tmp_path / "kept.pdf", status=PresentationStatus.COMPLETED)
+    db_session.add_all([failed, guest, kept])
+    await db_session.commit()
+
+    stats = await file_cleanup.cleanup_old_files(db_session)
+
+    assert stats["deleted_records"] == 2
+    assert stats["deleted_files"] == 2
+    assert stats["freed_bytes"] == 20
+    assert not (tmp_path / "failed.pdf").exists()
+    assert not (tmp_path / "guest.pdf").exists()
+    assert (tmp_path / "kept.pdf").exists()
+    remaining = (await db_session.execute(select(Presentation.file_path))).scalars().all()
+    assert remaining == [str(tmp_path / "kept.pdf")]
+
+@pytest.mark.asyncio
+async def test_cleanup_old_files_dry_run_keeps_everything(db_session, tmp_path):
+    """Test that a dry run reports what would go without deleting files or rows"""
+    now = datetime.now(timezone.utc)
+    db_session.add(make_presentation(tmp_path / "failed.pdf", status=PresentationStatus.FAILED, created_at=now - timedelta(days=30)))
+    await db_session.commit()
+
+    stats = await file_cleanup.cleanup_old_files(db_session, dry_run=True)
+
+    assert stats["deleted_records"] == 1
+    assert (tmp_path / "failed.pdf").exists()
+    assert len((await db_session.execute(select(Presentation.id))).all()) == 1
+
+@pytest.mark.asyncio
+async def test_cleanup_old_files_handles_rows_matching_both_rules(db_session, tmp_path):
+    """Test that a failed guest upload past both limits is cleaned up exactly once"""
+    now = datetime.now(timezone.utc)
+    db_session.add(make_presentation(
+        tmp_path / "both.pdf",
+        status=PresentationStatus.FAILED,
+        created_at=now - timedelta(days=30),
+        is_guest_upload=True,
+        expires_at=now - timedelta(days=1)
+    ))
+    await db_session.commit()
+
+    stats = await file_cleanup.cleanup_old_files(db_session)
+
+    assert stats["checked"] == 1
+    assert stats["deleted_records"] == 1
+    assert stats["errors"] == 0
+
+@pytest.mark.asyncio
+async def test_cleanup_orphaned_files_removes_only_old_untracked_files(db_session, tmp_path):
+    """Test that files without a presentation row are removed once they are old enough"""
+    db_session.add(make_presentation(tmp_path / "tracked.pdf"))
+    await db_session.commit()
+    (tmp_path / "nested").mkdir()
+    orphan = tmp_path / "nested" / "orphan.pdf"
+    orphan.write_bytes(b"x" * 5)
+    fresh = tmp_path / "fresh.pdf"
+    fresh.write_bytes(b"x")
+    two_hours_ago = (datetime.now(timezone.utc) - timedelta(hours=2)).timestamp()
+    for path in (tmp_path / "tracked.pdf", orphan):
+        os.utime(path, (two_hours_ago, two_hours_ago))
+
+    stats = await file_cleanup.cleanup_orphaned_files(db_session, upload_dir=str(tmp_path))
+
+    assert stats["checked"] == 3
+    assert stats["orphaned"] == 1
+    assert stats["freed_bytes"] == 5
+    assert not orphan.exists()
+    assert fresh.exists()
+    assert (tmp_path / "tracked.pdf").exists()
@@ -35,3 +35,29 @@ async def test_analyze_intent_logic(text, expected):
         result = await analyze_intent(text)
         assert result.intent == expected
         assert result.confidence >= 0.0
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("text, expected, slide_number", [
+    ("Next slide.", IntentType.NEXT_SLIDE, 3),
+    ("İleri", IntentType.NEXT_SLIDE, 3),
+    ("go back", IntentType.PREVIOUS_SLIDE, 1),
+    ("Geri dön!", IntentType.PREVIOUS_SLIDE, 1),
+])
+async def test_analyze_intent_bare_command_skips_llm(text, expected, slide_number):
+    """Verify that bare navigation commands are resolved without calling the model."""
+    with patch("app.services.intent_service.get_client") as mock_get_client:
+        result = await analyze_intent(text, current_slide=2, total_slides=5)
+        mock_get_client.assert_not_called()
+        assert result.intent == expected
+        assert result.slide_number == slide_number
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("text, current_slide, slide_number", [
+    ("next", 5, 5),
+    ("sonraki", 5, 5),
+    ("back", 1, 1),
+])
+async def test_analyze_intent_bare_command_stays_in_range(text, current_slide, slide_number):
+    """Verify that bare commands at either end of the deck target the current slide rather than None."""
+    result = await analyze_intent(text, current_slide=current_slide, total_slides=5)
+    assert result.slide_number == slide_number
@@ -0,0 +1,15 @@
+from fastapi.testclient import TestClient
+from main import app
+from app.services import embedding_service, intent_service, rag_service
+
+def test_openai_clients_are_rebuilt_after_restart():
+    """Test that a second app lifespan in the same process doesn't reuse clients around the closed HTTP client"""
+    services = (embedding_service, intent_service, rag_service)
+    with TestClient(app):
+        first = [service.get_client() for service in services]
+
+    with TestClient(app):
+        for service, old_client in zip(services, first):
+            client = service.get_client()
+            assert client is not old_client
+            assert not client._client.is_closed
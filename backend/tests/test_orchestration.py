@@ -2,6 +2,7 @@ import pytest
 import json
 import asyncio
 import tempfile
+import uuid
 from unittest.mock import AsyncMock, patch
 from app.api.v1.orchestration import manager
 from app.services.intent_service import IntentType, IntentResult
@@ -28,7 +29,7 @@ async def test_presentation(db_session):
 async def test_session(db_session, test_presentation):
     """Create an active presentation session"""
     session = PresentationSession(
-        session_uuid="test-uuid-123",
+        session_uuid=uuid.uuid4(),
         presentation_id=test_presentation.id,
         session_type=SessionType.LIVE,
         current_slide_index=1
@@ -129,3 +130,97 @@ async def test_websocket_jump_intent(sync_client, test_presentation, test_sessio
             assert data["type"] == "COMMAND"
             assert data["payload"]["intent"] == "JUMP_TO_SLIDE"
             assert data["payload"]["slide_number"] == 4
+
+@pytest.mark.asyncio
+async def test_websocket_skips_command_for_current_slide(sync_client, test_presentation, test_session):
+    """Test that a command landing on the slide already shown is not broadcast"""
+    results = [
+        IntentResult(intent=IntentType.NEXT_SLIDE, confidence=1.0, slide_number=5, original_text="next"),
+        IntentResult(intent=IntentType.JUMP_TO_SLIDE, confidence=0.99, slide_number=2, original_text="go to slide two"),
+    ]
+
+    with patch("app.services.intent_service.analyze_intent", AsyncMock(side_effect=results)):
+        with sync_client.websocket_connect(f"/api/v1/orchestration/ws/presentation/{test_presentation.id}") as websocket:
+            for transcript in ("next", "go to slide two"):
+                websocket.send_text(json.dumps({
+                    "transcript": transcript,
+                    "is_final": True,
+                    "current_page": 5,
+                    "total_pages": 5
+                }))
+
+            # The no-op "next" on the last slide is dropped, so the jump is the first thing received
+            data = websocket.receive_json()
+            assert data["type"] == "COMMAND"
+            assert data["payload"]["intent"] == "JUMP_TO_SLIDE"
+            assert data["payload"]["slide_number"] == 2
+
+@pytest.mark.asyncio
+async def test_websocket_reuses_analysis_for_repeated_transcript(sync_client, test_presentation, test_session):
+    """Test that a repeated final transcript at the same slide is not sent to the LLM again"""
+    mock_result = IntentResult(
+        intent=IntentType.JUMP_TO_SLIDE,
+        confidence=0.99,
+        slide_number=4,
+        original_text="jump to slide four"
+    )
+    analyze = AsyncMock(return_value=mock_result)
+
+    with patch("app.services.intent_service.analyze_intent", analyze):
+        with sync_client.websocket_connect(f"/api/v1/orchestration/ws/presentation/{test_presentation.id}") as websocket:
+            for transcript in ("jump to slide four", "Jump to slide four "):
+                websocket.send_text(json.dumps({
+                    "transcript": transcript,
+                    "is_final": True,
+                    "current_page": 1,
+                    "total_pages": 5
+                }))
+
+            for _ in range(2):
+                data = websocket.receive_json()
+                assert data["type"] == "COMMAND"
+                assert data["payload"]["slide_number"] == 4
+
+    assert analyze.await_count == 1
+
+@pytest.mark.asyncio
+async def test_websocket_disconnect_releases_connection(sync_client, test_presentation):
+    """Test that closing the socket removes it from the connection manager"""
+    presentation_id = str(test_presentation.id)
+    with sync_client.websocket_connect(f"/api/v1/orchestration/ws/presentation/{presentation_id}") as websocket:
+        websocket.send_text(json.dumps({"transcript": "hi", "is_final": False}))
+        websocket.receive_json()
+        assert presentation_id in manager.active_connections
+
+    # Give the server side a moment to run its cleanup
+    for _ in range(50):
+        if presentation_id not in manager.active_connections:
+            break
+        await asyncio.sleep(0.01)
+    assert presentation_id not in manager.active_connections
+
+@pytest.mark.asyncio
+async def test_flush_slide_updates_persists_latest_index(test_session):
+    """Test that queued slide positions are coalesced and written to the active session"""
+    from tests.conftest import TestingSessionLocal
+    from app.api.v1 import orchestration
+
+    orchestration.pending_slide_updates[test_session.presentation_id] = 2
+    orchestration.pending_slide_updates[test_session.presentation_id] = 4
+
+    with patch("app.api.v1.orchestration.AsyncSessionLocal", TestingSessionLocal):
+        await orchestration.flush_slide_updates()
+
+    assert orchestration.pending_slide_updates == {}
+    async with TestingSessionLocal() as session:
+        result = await session.execute(
+            select(PresentationSession.current_slide_index).where(PresentationSession.id == test_session.id)
+        )
+        assert result.scalar_one() == 4
+
+def test_websocket_rejects_non_numeric_id(sync_client):
+    """Test that a non-numeric presentation id is refused at handshake"""
+    from starlette.websockets import WebSocketDisconnect
+    with pytest.raises(WebSocketDisconnect):
+        with sync_client.websocket_connect("/api/v1/orchestration/ws/presentation/abc"):
+            pass
@@ -0,0 +1,235 @@
+import io
+import numpy as np
+import os
+import pytest
+import pypdf
+from pptx import Presentation as PptxPresentation
+from httpx import AsyncClient
+from unittest.mock import AsyncMock, patch
+
+async def auth_headers(client: AsyncClient) -> dict:
+    """Register and log in a user, returning the bearer auth header"""
+    await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "upload@example.com",
+            "password": "testpassword123",
+            "password_confirm": "testpassword123",
+            "full_name": "Upload User",
+            "birth_date": "1990-01-01"
+        }
+    )
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "upload@example.com", "password": "testpassword123"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+def make_pdf(pages: int = 2) -> bytes:
+    """Build a small blank PDF in memory"""
+    writer = pypdf.PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=612, height=792)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+def make_pptx(titles: list[str]) -> bytes:
+    """Build a small PPTX in memory with one titled slide per entry"""
+    prs = PptxPresentation()
+    for title in titles:
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = title
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+@pytest.mark.asyncio
+async def test_upload_pdf(client: AsyncClient):
+    """Test that a PDF upload is saved, extracted and listed"""
+    headers = await auth_headers(client)
+    fake_embeddings = AsyncMock(side_effect=lambda texts: np.zeros((len(texts), 1536), dtype=np.float32))
+
+    with patch("app.services.embedding_service.create_embeddings_batch", fake_embeddings):
+        response = await client.post(
+            "/api/v1/presentations/upload",
+            files={"file": ("deck.pdf", make_pdf(3), "application/pdf")},
+            headers=headers
+        )
+
+    assert response.status_code == 201
+    data = response.json()
+    assert data["pages"] == 3
+    assert data["status"] == "success"
+
+    listing = await client.get("/api/v1/presentations/", headers=headers)
+    assert listing.status_code == 200
+    assert [p["id"] for p in listing.json()] == [data["id"]]
+
+    saved_path = listing.json()[0]["file_path"]
+    assert os.path.exists(saved_path)
+    os.remove(saved_path)
+
+@pytest.mark.asyncio
+async def test_upload_rejects_invalid_magic_bytes(client: AsyncClient):
+    """Test that a file with a PDF extension but other content is rejected"""
+    headers = await auth_headers(client)
+    response = await client.post(
+        "/api/v1/presentations/upload",
+        files={"file": ("deck.pdf", b"not really a pdf", "application/pdf")},
+        headers=headers
+    )
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_upload_rejects_oversized_file(client: AsyncClient):
+    """Test that uploads over the size limit are rejected and not kept on disk"""
+    headers = await auth_headers(client)
+    before = set(os.listdir("uploaded_files"))
+
+    with patch("app.api.v1.presentations.MAX_FILE_SIZE", 100):
+        response = await client.post(
+            "/api/v1/presentations/upload",
+            files={"file": ("deck.pdf", make_pdf(1), "application/pdf")},
+            headers=headers
+        )
+
+    assert response.status_code == 400
+    assert set(os.listdir("uploaded_files")) == before
+
+@pytest.mark.asyncio
+async def test_upload_write_failure_leaves_no_file(client: AsyncClient):
+    """Test that a disk error while saving the upload is reported and the partial file is removed"""
+    headers = await auth_headers(client)
+    before = set(os.listdir("uploaded_files"))
+    disk_full = AsyncMock(side_effect=OSError(28, "No space left on device"))
+
+    with patch("aiofiles.threadpool.binary.AsyncBufferedIOBase.write", disk_full):
+        response = await client.post(
+            "/api/v1/presentations/upload",
+            files={"file": ("deck.pdf", make_pdf(1), "application/pdf")},
+            headers=headers
+        )
+
+    assert disk_full.await_count == 1
+    assert response.status_code == 422
+    assert set(os.listdir("uploaded_files")) == before
+
+@pytest.mark.asyncio
+async def test_get_and_delete_presentation(client: AsyncClient):
+    """Test fetching and deleting an uploaded presentation"""
+    headers = await auth_headers(client)
+    fake_embeddings = AsyncMock(side_effect=lambda texts: np.zeros((len(texts), 1536), dtype=np.float32))
+
+    with patch("app.services.embedding_service.create_embeddings_batch", fake_embeddings):
+        upload = await client.post(
+            "/api/v1/presentations/upload",
+            files={"file": ("deck.pdf", make_pdf(2), "application/pdf")},
+            headers=headers
+        )
+    presentation_id = upload.json()["id"]
+
+    response = await client.get(f"/api/v1/presentations/{presentation_id}", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["total_pages"] == 2
+    saved_path = response.json()["file_path"]
+
+    response = await client.delete(f"/api/v1/presentations/{presentation_id}", headers=headers)
+    assert response.status_code == 204
+    assert not os.path.exists(saved_path)
+
+    response = await client.get(f"/api/v1/presentations/{presentation_id}", headers=headers)
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_upload_pptx(client: AsyncClient):
+    """Test that PPTX slide text is extracted and embedded"""
+    headers = await auth_headers(client)
+    fake_embeddings = AsyncMock(side_effect=lambda texts: np.zeros((len(texts), 1536), dtype=np.float32))
+
+    with patch("app.services.embedding_service.create_embeddings_batch", fake_embeddings):
+        response = await client.post(
+            "/api/v1/presentations/upload",
+            files={"file": ("deck.pptx", make_pptx(["Intro", "Results"]), "application/octet-stream")},
+            headers=headers
+        )
+
+    assert response.status_code == 201
+    assert response.json()["pages"] == 2
+    fake_embeddings.assert_awaited_once_with(["Intro", "Results"])
+
+    listing = await client.get("/api/v1/presentations/", headers=headers)
+    os.remove(listing.json()[0]["file_path"])
+
+@pytest.mark.asyncio
+async def test_extract_pdf_path_in_parallel(tmp_path, monkeypatch):
+    """Test that large PDFs are extracted in page ranges across the process pool, in page order"""
+    from app.core import executors
+    from app.services import pdf_service
+
+    pdf_path = tmp_path / "deck.pdf"
+    pdf_path.write_bytes(make_pdf(40))
+    monkeypatch.setattr(pdf_service, "PARALLEL_EXTRACTION_MIN_SIZE", 0)
+
+    try:
+        slide_texts = await pdf_service.extract_text_from_pdf_path(str(pdf_path), pdf_path.stat().st_size)
+    finally:
+        executors.shutdown_extraction_pool()
+
+    assert slide_texts == [""] * 40
+
+@pytest.mark.asyncio
+async def test_upload_stores_streamed_file_hash(client: AsyncClient, db_session):
+    """Test that the hash computed while streaming matches the file written to disk"""
+    from app.models.presentation import Presentation
+    from app.services import file_validator
+
+    headers = await auth_headers(client)
+    fake_embeddings = AsyncMock(side_effect=lambda texts: np.zeros((len(texts), 1536), dtype=np.float32))
+
+    with patch("app.services.embedding_service.create_embeddings_batch", fake_embeddings):
+        response = await client.post(
+            "/api/v1/presentations/upload",
+            files={"file": ("deck.pdf", make_pdf(2), "application/pdf")},
+            headers=headers
+        )
+
+    presentation = await db_session.get(Presentation, response.json()["id"])
+    assert presentation.file_hash == file_validator.calculate_file_hash(presentation.file_path)
+    os.remove(presentation.file_path)
+
+@pytest.mark.asyncio
+async def test_upload_corrupt_pdf_is_rejected(client: AsyncClient):
+    """Test that extraction errors raised in the worker process surface as a processing failure"""
+    headers = await auth_headers(client)
+    before = set(os.listdir("uploaded_files"))
+
+    response = await client.post(
+        "/api/v1/presentations/upload",
+        files={"file": ("deck.pdf", b"%PDF-1.4 this is not a real pdf", "application/pdf")},
+        headers=headers
+    )
+
+    assert response.status_code == 422
+    assert set(os.listdir("uploaded_files")) == before
+
+@pytest.mark.asyncio
+async def test_upload_sanitizes_stored_filename(client: AsyncClient):
+    """Test that path separators and odd characters never reach the stored file path"""
+    headers = await auth_headers(client)
+    fake_embeddings = AsyncMock(side_effect=lambda texts: np.zeros((len(texts), 1536), dtype=np.float32))
+
+    with patch("app.services.embedding_service.create_embeddings_batch", fake_embeddings):
+        response = await client.post(
+            "/api/v1/presentations/upload",
+            files={"file": ("..\\..\\my deck;rm -rf.pdf", make_pdf(1), "application/pdf")},
+            headers=headers
+        )
+
+    assert response.status_code == 201
+    saved_path = (await client.get("/api/v1/presentations/", headers=headers)).json()[0]["file_path"]
+    directory, stored_name = saved_path.split("/", 1)
+    assert directory == "uploaded_files"
+    assert stored_name.endswith("_.._.._my_deck_rm_-rf.pdf")
+    assert os.path.exists(saved_path)
+    os.remove(saved_path)